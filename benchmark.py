@@ -0,0 +1,44 @@
+# Benchmark of Label Setting Algorithm
+# Author: CO2MAKER
+# Date: 2026.10.19
+import argparse
+from src.graph.SolomonLoader import TIME_FACTOR
+from src.labeling.BidirectionalLabelSetting import BidirectionalLabelSetting
+from src.labeling.DSSRLabelSetting import DSSRLabelSetting
+from src.labeling.LabelSetting import LabelSetting
+from src.test.Benchmark import Benchmark
+
+SOLVERS = {solver_class.__name__: solver_class
+           for solver_class in (LabelSetting, BidirectionalLabelSetting, DSSRLabelSetting)}
+
+parser = argparse.ArgumentParser(description='Benchmark label setting algorithm on the Solomon instances.')
+parser.add_argument('--families', nargs='+', default=['C1', 'C2', 'R1'])
+parser.add_argument('--node-nums', nargs='+', type=int, default=[10, 15])
+parser.add_argument('--time-factor', type=float, default=TIME_FACTOR, help='routing time per unit distance')
+parser.add_argument('--seed', type=int, default=0)
+parser.add_argument('--repeats', type=int, default=3, help='number of timed solves, whose median is reported')
+parser.add_argument('--output', default='bench_results.json')
+parser.add_argument('--no-memory', action='store_true', help='do not measure peak memory')
+parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two results files')
+parser.add_argument('--solver', choices=sorted(SOLVERS), default='LabelSetting')
+parser.add_argument('--check', type=int, metavar='SEEDS',
+                    help='check the reduced costs of solver against LabelSetting with seeds 0, ..., SEEDS - 1')
+args = parser.parse_args()
+if args.repeats < 1:
+    parser.error('--repeats should be positive')
+if args.check is not None and args.check < 1:
+    parser.error('--check should be positive')
+
+if args.compare:
+    Benchmark.compare(*args.compare)
+elif args.check is not None:
+    benchmark = Benchmark(families=args.families, node_nums=args.node_nums, time_factor=args.time_factor,
+                          solver_class=SOLVERS[args.solver], trace_memory=False)
+    if benchmark.check_equivalence(seeds=range(args.check)):
+        raise SystemExit(1)
+else:
+    benchmark = Benchmark(families=args.families, node_nums=args.node_nums, seed=args.seed,
+                          time_factor=args.time_factor, solver_class=SOLVERS[args.solver],
+                          trace_memory=not args.no_memory, repeats=args.repeats)
+    benchmark.run()
+    benchmark.save(args.output)
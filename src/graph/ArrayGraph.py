@@ -0,0 +1,131 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 4:10 PM
+# * Filename      : ArrayGraph
+# * Description   :
+# **********************************************************
+import numpy as np
+from src.graph.Graph import Graph
+from src.graph.GraphView import GraphView
+
+
+class ArrayGraph(Graph):
+
+    """Class for graph backed by NumPy arrays.
+
+    The graph is built from the same node list and edge dict as Graph, and additionally keeps the node data as
+    arrays indexed by node id, the adjacency as a dense boolean matrix and in CSR format, and the costs and routing
+    times as dense matrices, where the missing arcs are inf. The revised cost is revised by one vectorized
+    subtraction of the dual value into the revised_cost matrix, while revised_cost_map is still the dict of arcs as
+    in Graph.
+
+    Typical usage example:
+
+    graph = ArrayGraph(node_list_, edge_dict_)    # or ArrayGraph.from_graph(graph_)
+    graph.revise_cost_map(dual_val)
+    print(graph.revised_cost[graph.adjacency])
+
+    """
+
+    def __init__(self, node_list: list, edge_dict: dict, original_cost=None, routing_time=None):
+        super().__init__(node_list, edge_dict)
+        self._init_arrays(original_cost, routing_time)
+
+    def _init_arrays(self, original_cost=None, routing_time=None):
+        """Initialize the node arrays, the adjacency and the cost and routing time matrices.
+
+        Note that, the matrices are built from the edge dict unless they are given, e.g. by SolomonInstance, where the
+        missing arcs are inf.
+        """
+        node_list, edge_dict, n = self.node_list, self.edge_dict, self.node_num
+        self.demand = np.array([node.demand for node in node_list], dtype=float)
+        self.earliest_time = np.array([node.earliest_time for node in node_list], dtype=float)
+        self.latest_time = np.array([node.latest_time for node in node_list], dtype=float)
+        self.service_time = np.array([node.service_time for node in node_list], dtype=float)
+
+        if original_cost is not None and routing_time is not None:
+            self.original_cost = np.array(original_cost, dtype=float)
+            self.routing_time = np.array(routing_time, dtype=float)
+            self.adjacency = np.isfinite(self.original_cost)
+        else:
+            self.adjacency = np.zeros((n, n), dtype=bool)
+            self.original_cost = np.full((n, n), np.inf)
+            self.routing_time = np.full((n, n), np.inf)
+            for i in range(n):
+                for edge in edge_dict[i]:
+                    self.adjacency[i, edge.to_] = True
+                    self.original_cost[i, edge.to_] = edge.revised_cost
+                    self.routing_time[i, edge.to_] = edge.routing_time
+        self.revised_cost = self.original_cost.copy()
+        self._init_csr()
+
+    @classmethod
+    def from_graph(cls, graph: Graph):
+        """Build array-backed graph from a graph or a graph view."""
+        array_graph = cls(graph.node_list, {i: graph.edge_dict[i] for i in range(graph.node_num)})
+        array_graph.unreachable_masks = graph.unreachable_masks
+        return array_graph
+
+    def _init_csr(self):
+        """Initialize the CSR format of adjacency, i.e. the successors of node i are indices[indptr[i]:indptr[i + 1]]."""
+        rows, cols = np.nonzero(self.adjacency)
+        self.indptr = np.zeros(self.node_num + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.node_num), out=self.indptr[1:])
+        self.indices = cols.astype(np.int64)
+
+    def get_successors(self, node_id: int) -> np.ndarray:
+        """Get successor node ids of a node."""
+        return self.indices[self.indptr[node_id]:self.indptr[node_id + 1]]
+
+    def revise_dist_map(self, branch_arc: tuple, branch_value: int):
+        """Revise distance map and adjacency when branching."""
+        super().revise_dist_map(branch_arc, branch_value)
+        from_, to_ = branch_arc[0], branch_arc[1]
+        if branch_value == 0:
+            self.adjacency[from_, to_] = False
+        else:
+            is_to_node = np.arange(self.node_num) == to_
+            self.adjacency[from_] &= is_to_node
+        self._init_csr()
+
+    def preprocess(self, capacity=100) -> Graph:
+        """Tighten time windows and remove infeasible arcs in place, and rebuild the arrays."""
+        super().preprocess(capacity)
+        self._init_arrays()
+        return self
+
+    def revise_cost_map(self, dual_val: list):
+        """Revise cost map when perform Column Generation, i.e. one vectorized subtraction of dual value."""
+        np.subtract(self.original_cost, np.asarray(dual_val, dtype=float)[:, None], out=self.revised_cost)
+        rows, cols = np.nonzero(self.adjacency)
+        self.revised_cost_map = dict(zip(zip(rows.tolist(), cols.tolist()), self.revised_cost[rows, cols].tolist()))
+        self.revised_cost_rows = self.revised_cost.tolist()
+
+    def get_view(self, branch_decisions=None):
+        """Get a lightweight view of the graph with branching decisions, see ArrayGraphView."""
+        return ArrayGraphView(self, branch_decisions)
+
+
+class ArrayGraphView(GraphView, ArrayGraph):
+
+    """Class for lightweight view of an array-backed graph with branching decisions.
+
+    The view shares the node arrays and the cost and routing time matrices with the underlying graph, and only
+    copies the adjacency matrix if it is revised by branching decisions.
+
+    """
+
+    def __init__(self, graph: ArrayGraph, branch_decisions=None):
+        self.demand = graph.demand
+        self.earliest_time = graph.earliest_time
+        self.latest_time = graph.latest_time
+        self.service_time = graph.service_time
+        self.adjacency = graph.adjacency
+        self.original_cost = graph.original_cost
+        self.routing_time = graph.routing_time
+        self.revised_cost = graph.original_cost.copy()
+        self.indptr, self.indices = graph.indptr, graph.indices
+        if branch_decisions:
+            self.adjacency = graph.adjacency.copy()
+        super().__init__(graph, branch_decisions)
@@ -31,6 +31,9 @@ class Graph:
         self.edge_dict = edge_dict    # key: node id, value: edge list
         self.original_cost_map = {}
         self.revised_cost_map = {}
+        self.revised_cost_rows = [{} for _ in node_list]    # revised_cost_rows[from_][to_], for fast lookup
+        self._dual_val = None    # dual value of the last revision of cost map
+        self.unreachable_masks = None    # nodes never reachable after visiting node i, see GraphPreprocessor
 
         # check if the number of nodes are equal, otherwise raise NotEqual exception
         if len(node_list) != len(edge_dict):
@@ -55,6 +58,14 @@ class Graph:
             cur = shortest_path[next_]
         return cost
 
+    def get_reversed_edge_dict(self) -> dict:
+        """Get the incoming edge list for every node, i.e. the edge dict of the reversed graph."""
+        reversed_edge_dict = {i: [] for i in range(self.node_num)}
+        for i in range(self.node_num):
+            for edge in self.edge_dict[i]:
+                reversed_edge_dict[edge.to_].append(edge)
+        return reversed_edge_dict
+
     def outgoing_edge_sort(self):
         """Sort the outgoing edge for every node.
 
@@ -66,22 +77,41 @@ class Graph:
             self.edge_dict[node_index].sort()
 
     def revise_dist_map(self, branch_arc: tuple, branch_value: int):
-        """Revise distance map when branching."""
+        """Revise distance map when branching.
+
+        Note that, the edge list of from_ node is replaced by a new list rather than revised in place.
+        """
         from_, to_ = branch_arc[0], branch_arc[1]
         if branch_value == 0:
             # Remove the branch arc from edge list
-            for edge in self.edge_dict[from_]:
-                if edge.to_ == to_:
-                    self.edge_dict[from_].remove(edge)
+            self.edge_dict[from_] = [edge for edge in self.edge_dict[from_] if edge.to_ != to_]
         else:
             # Remove all the arcs between from_ and to_ node of branch arc except the branch arc
-            for edge in self.edge_dict[from_]:
-                if edge.to_ != to_:
-                    self.edge_dict[from_].remove(edge)
+            self.edge_dict[from_] = [edge for edge in self.edge_dict[from_] if edge.to_ == to_]
 
     def revise_cost_map(self, dual_val: list):
-        """Revise cost map when perform Column Generation."""
-        for key in self.original_cost_map.keys():
-            from_ = key[0]
-            self.revised_cost_map[key] = self.original_cost_map[key] - dual_val[from_]
+        """Revise cost map when perform Column Generation.
+
+        Note that, only the arcs whose from_ node has a different dual value from the last revision are revised.
+        """
+        last_dual_val = self._dual_val
+        for from_ in range(self.node_num):
+            dual = dual_val[from_]
+            if last_dual_val is not None and last_dual_val[from_] == dual:
+                continue
+            revised_cost_row = self.revised_cost_rows[from_]
+            for edge in self.edge_dict[from_]:
+                key = from_, edge.to_
+                self.revised_cost_map[key] = revised_cost_row[edge.to_] = self.original_cost_map[key] - dual
+        self._dual_val = list(dual_val)
+
+    def preprocess(self, capacity=100) -> 'Graph':
+        """Tighten time windows and remove infeasible arcs in place, see GraphPreprocessor."""
+        from src.graph.GraphPreprocessor import GraphPreprocessor
+        return GraphPreprocessor(self, capacity).run()
+
+    def get_view(self, branch_decisions=None):
+        """Get a lightweight view of the graph with branching decisions, see GraphView."""
+        from src.graph.GraphView import GraphView
+        return GraphView(self, branch_decisions)
 
@@ -0,0 +1,173 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:55 PM
+# * Filename      : GraphPreprocessor
+# * Description   :
+# **********************************************************
+from copy import copy
+from heapq import heappush, heappop
+from src.graph.Graph import Graph
+
+
+class GraphPreprocessor:
+
+    """Class for preprocessing a graph once before label setting.
+
+    The preprocessing tightens the time windows of nodes by the time windows of their predecessors and successors,
+    removes the arcs which are infeasible by routing time or demand, and the arcs to the nodes from which no other
+    node can be reached, until nothing changes. Then for every node i, the nodes which can never be visited after
+    node i, i.e. unreachable_masks[i], are computed as bitmasks.
+
+    Note that, the graph is revised in place, i.e. the node list is replaced by copies of the nodes with tightened
+    time windows, the edge lists are replaced by reduced lists, and graph.unreachable_masks is set, which is used by
+    LabelSetting. The original GraphNode objects are not changed, hence the other graphs sharing them are not
+    affected. The graph should be preprocessed before creating any view of it, and the tightened time windows are
+    still valid for the views with branching decisions.
+
+    Typical usage example:
+
+    preprocessor = GraphPreprocessor(graph_, capacity=200)
+    preprocessor.run()    # or graph_.preprocess(capacity=200)
+    print(preprocessor.removed_edge_num)
+
+    """
+
+    def __init__(self, graph: Graph, capacity=100, max_iter_num=100):
+        self.graph = graph
+        self.capacity = capacity
+        self.max_iter_num = max_iter_num
+        self.removed_edge_num = 0
+        self.tightened_node_num = 0
+        self.unreachable_masks = None
+
+    def run(self) -> Graph:
+        """Preprocess the graph, and return the revised graph."""
+        graph = self.graph
+        edge_num = sum(len(graph.edge_dict[i]) for i in range(graph.node_num))
+        time_windows = [(node.earliest_time, node.latest_time) for node in graph.node_list]
+        # Tighten copies of the nodes, which may be shared by other graphs
+        graph.node_list = [copy(node) for node in graph.node_list]
+
+        for _ in range(self.max_iter_num):
+            is_edge_removed = self._remove_infeasible_edges()
+            is_time_window_tightened = self._tighten_time_windows()
+            if not is_edge_removed and not is_time_window_tightened:
+                break
+        self._cal_unreachable_masks()
+
+        self.removed_edge_num = edge_num - sum(len(graph.edge_dict[i]) for i in range(graph.node_num))
+        self.tightened_node_num = sum(
+            (node.earliest_time, node.latest_time) != time_window
+            for node, time_window in zip(graph.node_list, time_windows)
+        )
+        graph.unreachable_masks = self.unreachable_masks
+        return graph
+
+    def _get_start_time(self, node_id: int):
+        """Get the minimal routing time at node, where the routing time of source node is 0."""
+        return self.graph.node_list[node_id].earliest_time if node_id != 0 else 0
+
+    def _get_end_time(self, node_id: int):
+        """Get the maximal routing time at node, where the routing time of source node is 0."""
+        return self.graph.node_list[node_id].latest_time if node_id != 0 else 0
+
+    def _remove_infeasible_edges(self) -> bool:
+        """Remove the infeasible edges, and return whether any edge is removed."""
+        graph, node_list, sink = self.graph, self.graph.node_list, self.graph.node_num - 1
+        is_edge_removed = False
+        for i in range(graph.node_num):
+            min_demand = node_list[i].demand if i != 0 else 0
+            start_time = self._get_start_time(i)
+            edges = []
+            for edge in graph.edge_dict[i]:
+                to_node = node_list[edge.to_]
+                if min_demand + to_node.demand > self.capacity:
+                    continue
+                if start_time + to_node.service_time + edge.routing_time > to_node.latest_time:
+                    continue
+                # No node can be reached after to_ node
+                if edge.to_ != sink and not graph.edge_dict[edge.to_]:
+                    continue
+                edges.append(edge)
+            if len(edges) != len(graph.edge_dict[i]):
+                graph.edge_dict[i] = edges
+                is_edge_removed = True
+        return is_edge_removed
+
+    def _tighten_time_windows(self) -> bool:
+        """Tighten the time windows of nodes except the source node, and return whether any one is tightened.
+
+        Note that, the routing time at node j is max(earliest time of j, routing time at i + service time of j +
+        routing time of (i, j)), hence the routing time at node j is bounded by its predecessors, and the node j
+        has to leave early enough to reach one of its successors.
+        """
+        graph, node_list, sink = self.graph, self.graph.node_list, self.graph.node_num - 1
+        reversed_edge_dict = graph.get_reversed_edge_dict()
+        is_tightened = False
+        for j in range(1, graph.node_num):
+            node = node_list[j]
+            incoming_edges = reversed_edge_dict[j]
+            if not incoming_edges:
+                # The node can not be visited, and so are its outgoing edges
+                if graph.edge_dict[j]:
+                    graph.edge_dict[j] = []
+                    is_tightened = True
+                continue
+            earliest_time, latest_time = node.earliest_time, node.latest_time
+            # Bounded by predecessors
+            earliest_arrival = min(
+                self._get_start_time(edge.from_) + node.service_time + edge.routing_time for edge in incoming_edges
+            )
+            latest_arrival = max(
+                self._get_end_time(edge.from_) + node.service_time + edge.routing_time for edge in incoming_edges
+            )
+            earliest_time = max(earliest_time, min(latest_time, earliest_arrival))
+            latest_time = min(latest_time, max(earliest_time, latest_arrival))
+            # Bounded by successors, i.e. waiting at node j does not change the routing time at the successors
+            if j != sink and graph.edge_dict[j]:
+                latest_departure, earliest_departure = float('-inf'), float('inf')
+                for edge in graph.edge_dict[j]:
+                    to_node = node_list[edge.to_]
+                    offset = to_node.service_time + edge.routing_time
+                    latest_departure = max(latest_departure, to_node.latest_time - offset)
+                    earliest_departure = min(earliest_departure, to_node.earliest_time - offset)
+                latest_time = min(latest_time, max(earliest_time, latest_departure))
+                earliest_time = max(earliest_time, min(latest_time, earliest_departure))
+            if earliest_time != node.earliest_time or latest_time != node.latest_time:
+                node.earliest_time, node.latest_time = earliest_time, latest_time
+                is_tightened = True
+        return is_tightened
+
+    def _cal_unreachable_masks(self):
+        """Calculate unreachable nodes by the earliest arrival time from every node.
+
+        Note that, the earliest arrival time is calculated by Dijkstra's algorithm, where elementarity is relaxed,
+        since the routing time at a node is non-decreasing in the routing time at its predecessor.
+        """
+        graph, node_list, n = self.graph, self.graph.node_list, self.graph.node_num
+        all_mask = (1 << n) - 1
+        self.unreachable_masks = []
+        for source in range(n):
+            min_demand = node_list[source].demand if source != 0 else 0
+            arrival_time = {source: self._get_start_time(source)}
+            heap = [(arrival_time[source], source)]
+            reachable_mask = 0
+            while heap:
+                routing_time, i = heappop(heap)
+                if routing_time > arrival_time[i]:
+                    continue
+                reachable_mask |= 1 << i
+                for edge in graph.edge_dict[i]:
+                    to_node = node_list[edge.to_]
+                    if min_demand + to_node.demand > self.capacity:
+                        continue
+                    next_routing_time = max(
+                        to_node.earliest_time, routing_time + to_node.service_time + edge.routing_time
+                    )
+                    if next_routing_time > to_node.latest_time:
+                        continue
+                    if next_routing_time < arrival_time.get(edge.to_, float('inf')):
+                        arrival_time[edge.to_] = next_routing_time
+                        heappush(heap, (next_routing_time, edge.to_))
+            self.unreachable_masks.append(all_mask & ~reachable_mask)
@@ -0,0 +1,49 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 3:05 PM
+# * Filename      : GraphView
+# * Description   :
+# **********************************************************
+from src.graph.Graph import Graph
+
+
+class GraphView(Graph):
+
+    """Class for lightweight view of a graph with branching decisions.
+
+    The view shares the node list, the edges and the original cost map with the underlying graph, and only the
+    outgoing edge lists of the nodes revised by branching decisions are replaced by new lists. Hence, creating a
+    view costs O(n) plus the degree of the branched nodes, instead of copying every node and edge. Since the
+    revised cost map depends on the dual value, every view has its own revised cost map.
+
+    Typical usage example:
+
+    graph_view = GraphView(graph_, [((1, 2), 0), ((3, 4), 1)])
+    print(graph_view.branch_decisions)
+
+    """
+
+    def __init__(self, graph: Graph, branch_decisions=None):
+        self.node_list = graph.node_list
+        self.edge_dict = dict(graph.edge_dict)    # shallow copy, the edge lists are shared until revised
+        self.original_cost_map = graph.original_cost_map
+        self.revised_cost_map = {}
+        self.revised_cost_rows = [{} for _ in range(graph.node_num)]
+        self._dual_val = None
+        self.unreachable_masks = graph.unreachable_masks
+        self.node_num = graph.node_num
+        self.branch_decisions = []    # list of (branch_arc, branch_value)
+
+        for branch_arc, branch_value in branch_decisions or []:
+            self.revise_dist_map(branch_arc, branch_value)
+
+    def outgoing_edge_sort(self):
+        """Sort the outgoing edge for every node without revising the shared edge lists."""
+        for node_index in range(self.node_num):
+            self.edge_dict[node_index] = sorted(self.edge_dict[node_index])
+
+    def revise_dist_map(self, branch_arc: tuple, branch_value: int):
+        """Revise distance map when branching, and record the branching decision."""
+        super().revise_dist_map(branch_arc, branch_value)
+        self.branch_decisions.append((branch_arc, branch_value))
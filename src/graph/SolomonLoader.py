@@ -0,0 +1,210 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 1:20 AM
+# * Filename      : SolomonLoader
+# * Description   :
+# **********************************************************
+import hashlib
+import json
+import os
+import numpy as np
+from src.graph.ArrayGraph import ArrayGraph
+from src.graph.Graph import Graph
+from src.graph.GraphEdge import GraphEdge
+from src.graph.GraphNode import GraphNode
+
+# Columns of node data
+NODE_FIELDS = ('x_coord', 'y_coord', 'demand', 'ready_time', 'due_time', 'service_time')
+# Default routing time of arc per unit distance, as in LabelSettingTest
+TIME_FACTOR = 15
+
+
+class SolomonInstance:
+
+    """Class for a Solomon instance as arrays.
+
+    The node data is an array of shape (node_num, 6) with columns NODE_FIELDS, and the cost and routing time are
+    (node_num, node_num) matrices, where the missing arcs are inf. As in LabelSettingTest, node 0 is the source node
+    and node node_num - 1 is the sink node, the routing time of arc (i, j) is time_factor (TIME_FACTOR by default)
+    times the floored euclidean distance, and the cost is the floored euclidean distance multiplied by a random
+    integer in [1, 5] drawn with the seed, or by 1 if the seed is None.
+
+    Typical usage example:
+
+    inst = SolomonInstance.from_json('./res/solomon-json/C101.json', node_num=100, seed=0)
+    graph = inst.get_graph()
+
+    """
+
+    def __init__(self, inst_name: str, capacity, vehicle_num, node_data: np.ndarray, cost: np.ndarray,
+                 routing_time: np.ndarray, unreachable_bits=None):
+        self.inst_name = inst_name
+        self.capacity = capacity
+        self.vehicle_num = vehicle_num
+        self.node_num = len(node_data)
+        self.node_data = node_data
+        self.cost = cost
+        self.routing_time = routing_time
+        self.unreachable_bits = unreachable_bits    # packed bits of graph.unreachable_masks, see GraphPreprocessor
+
+    @classmethod
+    def from_json(cls, inst_file_path: str, node_num=None, seed=None, time_factor=TIME_FACTOR):
+        """Parse instance file, and build the cost and routing time matrices."""
+        with open(inst_file_path, 'r') as f:
+            solomon_inst = json.load(f)
+        customers = solomon_inst['all_customers']
+        node_num = node_num or len(customers)
+        node_data = np.array(
+            [[customers[str(i)][field] for field in NODE_FIELDS] for i in range(node_num)], dtype=float
+        )
+        # Floored euclidean distance
+        coord = node_data[:, :2]
+        distance = np.floor(np.sqrt(((coord[:, None, :] - coord[None, :, :]) ** 2).sum(axis=2)))
+        # Arcs from every node except the sink node, to every node except the source node
+        has_arc = np.ones((node_num, node_num), dtype=bool)
+        has_arc[node_num - 1, :] = False
+        has_arc[:, 0] = False
+        np.fill_diagonal(has_arc, False)
+        if seed is None:
+            cost_factor = np.ones((node_num, node_num))
+        else:
+            cost_factor = np.random.default_rng(seed).integers(1, 6, size=(node_num, node_num)).astype(float)
+        cost = np.where(has_arc, cost_factor * distance, np.inf)
+        routing_time = np.where(has_arc, time_factor * distance, np.inf)
+        return cls(solomon_inst['inst_name'], solomon_inst['capacity'], solomon_inst['vehicle_num'],
+                   node_data, cost, routing_time)
+
+    @classmethod
+    def from_graph(cls, inst_name: str, capacity, vehicle_num, graph: Graph):
+        """Build instance from a graph, e.g. a preprocessed graph."""
+        n = graph.node_num
+        node_data = np.array([
+            [node.x_coord, node.y_coord, node.demand, node.earliest_time, node.latest_time, node.service_time]
+            for node in graph.node_list
+        ], dtype=float)
+        cost, routing_time = np.full((n, n), np.inf), np.full((n, n), np.inf)
+        for i in range(n):
+            for edge in graph.edge_dict[i]:
+                cost[i, edge.to_] = graph.original_cost_map[i, edge.to_]
+                routing_time[i, edge.to_] = edge.routing_time
+        unreachable_bits = None
+        if graph.unreachable_masks is not None:
+            unreachable_bits = np.array(
+                [list(mask.to_bytes((n + 7) // 8, 'little')) for mask in graph.unreachable_masks], dtype=np.uint8
+            )
+        return cls(inst_name, capacity, vehicle_num, node_data, cost, routing_time, unreachable_bits)
+
+    def get_graph(self, graph_class=Graph) -> Graph:
+        """Build graph, e.g. Graph or ArrayGraph.
+
+        Note that, the edges are built from the nonzero arcs of the matrices by one map, and ArrayGraph takes the
+        matrices as they are rather than rebuilding them from the edges.
+        """
+        node_list = [GraphNode(i, *row) for i, row in enumerate(self.node_data.tolist())]
+        rows, cols = np.nonzero(np.isfinite(self.cost))
+        edges = list(map(GraphEdge, rows.tolist(), cols.tolist(), self.cost[rows, cols].tolist(),
+                         self.routing_time[rows, cols].tolist()))
+        # The edges are sorted by from_ node, i.e. the edges of node i are edges[indptr[i]:indptr[i + 1]]
+        indptr = [0] + np.cumsum(np.bincount(rows, minlength=self.node_num)).tolist()
+        edge_dict = {i: edges[indptr[i]:indptr[i + 1]] for i in range(self.node_num)}
+        if issubclass(graph_class, ArrayGraph):
+            graph = graph_class(node_list, edge_dict, self.cost, self.routing_time)
+        else:
+            graph = graph_class(node_list, edge_dict)
+        if self.unreachable_bits is not None:
+            graph.unreachable_masks = [int.from_bytes(row.tobytes(), 'little') for row in self.unreachable_bits]
+        return graph
+
+
+class SolomonLoader:
+
+    """Class for loading Solomon instances with a binary cache.
+
+    The instance is parsed from inst_dir at the first time, and saved as .npy files in cache_dir, keyed by the
+    instance name, node number, seed, time factor and the capacity used by preprocessing, and a digest of the path,
+    modification time and size of the instance file, and then it is loaded as memory-mapped arrays. Hence, the
+    instances of different inst_dir have different caches, and the cache is rebuilt if the instance file is revised.
+    If capacity is given, the graph is preprocessed with the capacity before being cached, see GraphPreprocessor.
+
+    Typical usage example:
+
+    loader = SolomonLoader(cache_dir='./res/cache')
+    inst = loader.load('C101', node_num=100, seed=0)
+    graph = inst.get_graph()
+
+    """
+
+    def __init__(self, inst_dir='./res/solomon-json', cache_dir=None):
+        self.inst_dir = inst_dir
+        self.cache_dir = cache_dir
+
+    def load(self, inst_name: str, node_num=None, seed=None, capacity=None,
+             time_factor=TIME_FACTOR) -> SolomonInstance:
+        """Load instance, from the cache if possible.
+
+        Args:
+            inst_name: instance name, e.g. 'C101'
+            node_num: number of nodes, i.e. the first node_num nodes of instance, or all the nodes if None
+            seed: seed of cost generation
+            capacity: capacity used by preprocessing, or None if the graph is not preprocessed
+            time_factor: routing time of arc per unit distance
+
+        Returns: Solomon instance.
+
+        """
+        inst_file_path, cache_path = os.path.join(self.inst_dir, f'{inst_name}.json'), None
+        if self.cache_dir is not None:
+            cache_path = os.path.join(self.cache_dir, f'{inst_name}-{node_num}-{seed}-{time_factor}-{capacity}-'
+                                                      f'{self._get_file_digest(inst_file_path)}')
+            if os.path.exists(os.path.join(cache_path, 'meta.json')):
+                return self._load_cache(cache_path)
+
+        inst = SolomonInstance.from_json(inst_file_path, node_num, seed, time_factor)
+        if capacity is not None:
+            graph = inst.get_graph().preprocess(capacity)
+            inst = SolomonInstance.from_graph(inst.inst_name, inst.capacity, inst.vehicle_num, graph)
+        if cache_path is not None:
+            self._save_cache(cache_path, inst)
+        return inst
+
+    @staticmethod
+    def _get_file_digest(file_path: str) -> str:
+        """Get the digest of the absolute path, modification time and size of the file."""
+        stat = os.stat(file_path)
+        source = f'{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}'
+        return hashlib.sha1(source.encode()).hexdigest()[:12]
+
+    @staticmethod
+    def _save_cache(cache_path: str, inst: SolomonInstance):
+        os.makedirs(cache_path, exist_ok=True)
+        np.save(os.path.join(cache_path, 'node_data.npy'), inst.node_data)
+        np.save(os.path.join(cache_path, 'cost.npy'), inst.cost)
+        np.save(os.path.join(cache_path, 'routing_time.npy'), inst.routing_time)
+        if inst.unreachable_bits is not None:
+            np.save(os.path.join(cache_path, 'unreachable_bits.npy'), inst.unreachable_bits)
+        # meta.json is written at last, so that a cache is complete if meta.json exists
+        with open(os.path.join(cache_path, 'meta.json'), 'w') as f:
+            json.dump({
+                'inst_name': inst.inst_name,
+                'capacity': inst.capacity,
+                'vehicle_num': inst.vehicle_num,
+                'has_unreachable_bits': inst.unreachable_bits is not None
+            }, f)
+
+    @staticmethod
+    def _load_cache(cache_path: str) -> SolomonInstance:
+        with open(os.path.join(cache_path, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+        unreachable_bits = None
+        if meta['has_unreachable_bits']:
+            unreachable_bits = np.load(os.path.join(cache_path, 'unreachable_bits.npy'), mmap_mode='r')
+        return SolomonInstance(
+            meta['inst_name'],
+            meta['capacity'],
+            meta['vehicle_num'],
+            np.load(os.path.join(cache_path, 'node_data.npy'), mmap_mode='r'),
+            np.load(os.path.join(cache_path, 'cost.npy'), mmap_mode='r'),
+            np.load(os.path.join(cache_path, 'routing_time.npy'), mmap_mode='r'),
+            unreachable_bits
+        )
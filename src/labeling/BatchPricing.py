@@ -0,0 +1,100 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 9:30 PM
+# * Filename      : BatchPricing
+# * Description   :
+# **********************************************************
+from concurrent.futures import ProcessPoolExecutor
+from src.graph.Graph import Graph
+from src.labeling.Column import Column
+from src.labeling.LabelSetting import LabelSetting
+
+# The graph and solver settings of the worker process, which are set once by _init_worker
+_worker_context = {}
+
+
+def _init_worker(graph: Graph, solver_class, capacity, solver_kwargs: dict):
+    """Initialize the worker process, so that the graph is shared by all the jobs of the worker."""
+    _worker_context['graph'] = graph
+    _worker_context['solver_class'] = solver_class
+    _worker_context['capacity'] = capacity
+    _worker_context['solver_kwargs'] = solver_kwargs
+
+
+def _solve_job(job: tuple) -> list:
+    """Solve one pricing job in the worker process, and return the columns found."""
+    dual_val, branch_decisions = job
+    solver = _worker_context['solver_class'](
+        _worker_context['graph'],
+        capacity=_worker_context['capacity'],
+        branch_decisions=branch_decisions,
+        **_worker_context['solver_kwargs']
+    )
+    return _solve(solver, dual_val)
+
+
+def _solve(solver: LabelSetting, dual_val: list) -> list:
+    """Solve the pricing problem and collect the columns found by the solver."""
+    solver.solve(dual_val)
+    if getattr(solver, 'columns', None):
+        # The columns of FleetLabelSetting are None for the vehicle types without path
+        return [column for column in solver.columns if column is not None]
+    if not solver.shortest_path:
+        return []
+    return [Column(solver.shortest_path, solver.reduced_cost, solver.original_cost)]
+
+
+class BatchPricing:
+
+    """Class for solving many pricing problems on a process pool.
+
+    Every job is a tuple of (dual_val, branch_decisions), where branch_decisions is a list of
+    (branch_arc, branch_value) or None. The graph is sent to every worker process once when the pool starts,
+    rather than being pickled for every job, and the pool is kept between calls of solve until close is called.
+
+    Typical usage example:
+
+    with BatchPricing(graph_, processes=4) as pricing:
+        results = pricing.solve([(dual_val_1, None), (dual_val_2, [((1, 2), 0)])])
+    for columns in results:
+        print([str(column) for column in columns])
+
+    """
+
+    def __init__(self, graph: Graph, capacity=100, solver_class=LabelSetting, processes=None, **solver_kwargs):
+        self.graph = graph
+        self.capacity = capacity
+        self.solver_class = solver_class
+        self.processes = processes
+        self.solver_kwargs = solver_kwargs
+        self._executor = None
+
+    def solve(self, jobs: list) -> list:
+        """Solve pricing jobs in parallel.
+
+        Args:
+            jobs: list of (dual_val, branch_decisions)
+
+        Returns: list of column lists, i.e. the columns found for every job, in the order of jobs.
+
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_init_worker,
+                initargs=(self.graph, self.solver_class, self.capacity, self.solver_kwargs)
+            )
+        return list(self._executor.map(_solve_job, jobs))
+
+    def close(self):
+        """Shut down the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
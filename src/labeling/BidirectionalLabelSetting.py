@@ -0,0 +1,235 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:05 AM
+# * Filename      : BidirectionalLabelSetting
+# * Description   :
+# **********************************************************
+from src.graph.Graph import Graph
+from src.graph.GraphEdge import GraphEdge
+from src.labeling.Column import Column
+from src.labeling.LabelSetting import LabelSetting, Label
+from src.labeling.LabelQueue import HeapLabelQueue
+from src.labeling.LabelStore import LabelStore
+
+
+class BackwardLabel(Label):
+
+    """Class for backward label in the bidirectional label setting algorithm.
+
+    A backward label at node j represents a partial path from node j to the sink node, where revised_cost and
+    demand are accumulated along the partial path (including node j and the sink node), and routing_time is the
+    latest routing time at node j such that the partial path is still feasible. The pre_label of a backward label
+    is the label of the next node on the path.
+
+    """
+
+    __slots__ = ()
+
+    def dominate(self, other, flag=False) -> bool:
+        """Check whether can dominate other backward label, where the larger routing time is better."""
+        if (self.demand > other.demand) or (self.revised_cost > other.revised_cost) or (self.routing_time < other.routing_time):
+            return False
+        if self.reachable_nodes_num < other.reachable_nodes_num:
+            return False
+        if other.reachable_mask & ~self.reachable_mask:
+            return False
+
+        return True
+
+
+class BidirectionalLabelSetting(LabelSetting):
+
+    """Class for bidirectional label setting algorithm.
+
+    Forward labels are extended from the source node while the routing time is not larger than the midpoint, and
+    backward labels are extended from the sink node on the reversed graph while the latest routing time is larger
+    than the midpoint. Every complete path is the join of a forward label at node i, an edge (i, j) and a backward
+    label at node j, where i is the last node whose routing time is not larger than the midpoint.
+
+    Note that, only the shortest path is reported as a column, i.e. ValueError is raised if max_columns is larger
+    than 1.
+
+    Typical usage example:
+
+    ls = BidirectionalLabelSetting(graph_)
+    ls.solve(dual_val)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, midpoint=None, **kwargs):
+        if kwargs.get('max_columns', 1) > 1:
+            raise ValueError(f'Multiple columns of {type(self).__name__} are not supported.')
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+        self.reversed_edge_dict = self.graph.get_reversed_edge_dict()
+        # By default, the midpoint is a half of the time horizon
+        if midpoint is None:
+            midpoint = max(node.latest_time for node in self.graph.node_list) / 2
+        self.midpoint = midpoint
+
+        self._backward_unprocessed_labels = HeapLabelQueue()
+        self._backward_label_dict = self._init_backward_label_dict()
+
+    def solve(self, dual_val: list):
+        """Solve a elementary shortest path problem via bidirectional labeling approach."""
+        self.reset()
+        self._start_budget()
+        self._revise_cost(dual_val)
+        sink = self.graph.node_num - 1
+        # Forward labeling from source node
+        self._init_source_label()
+        self._process_labels()
+        # Backward labeling from sink node
+        sink_node = self.graph.node_list[sink]
+        init_label = BackwardLabel(sink, 0, sink_node.latest_time, sink_node.demand)
+        if sink_node.demand <= self.capacity:
+            all_nodes_mask = (1 << self.graph.node_num) - 1
+            init_label.update_reachable_mask(self._cal_backward_reachable_mask(all_nodes_mask, init_label))
+            self._backward_label_dict[sink].insert(init_label)
+            self._backward_unprocessed_labels.put_nowait(init_label)
+        self._process_backward_labels()
+
+        # Join forward and backward labels
+        forward_label, backward_label = self.join()
+        is_truncated = self._is_truncated or any(
+            store.is_truncated for store in [*self._label_dict.values(), *self._backward_label_dict.values()]
+        )
+        if forward_label is not None:
+            self.status = 'truncated' if is_truncated else 'optimal'
+            self.shortest_path = forward_label.get_visited_nodes() + backward_label.get_visited_nodes()[::-1]
+            self.original_cost = self.graph.get_original_cost(self.shortest_path)
+            self.columns = [Column(self.shortest_path, self.reduced_cost, self.original_cost)]
+        else:
+            self.status = 'truncated' if is_truncated else 'infeasible'
+
+    def _process_backward_labels(self):
+        """Extend the unprocessed backward labels until the queue is empty or the budget is exhausted."""
+        has_budget = self._has_budget()
+        while not self._backward_unprocessed_labels.empty():
+            cur_label = self._backward_unprocessed_labels.get_nowait()
+            if cur_label.is_dominated:
+                continue
+            if has_budget and self._is_budget_exhausted():
+                break
+            for edge in self.reversed_edge_dict[cur_label.graph_node_id]:
+                self.backward_label_extension(cur_label, edge)
+
+    def backward_label_extension(self, cur_label: BackwardLabel, in_edge: GraphEdge):
+        """Extend backward label to reachable predecessor nodes."""
+        cur_node_id, pre_node_id = cur_label.graph_node_id, in_edge.from_
+
+        if not (cur_label.reachable_mask >> pre_node_id) & 1:
+            return
+
+        cur_node, pre_node = self.graph.node_list[cur_node_id], self.graph.node_list[pre_node_id]
+        demand = cur_label.demand + pre_node.demand
+        routing_time = min(cur_node.latest_time, cur_label.routing_time) - cur_node.service_time - in_edge.routing_time
+        if routing_time > pre_node.latest_time:
+            routing_time = pre_node.latest_time
+        # The backward labels are only extended while the latest routing time is larger than the midpoint
+        if routing_time <= self.midpoint:
+            return
+        revised_cost = cur_label.revised_cost + self.graph.revised_cost_rows[pre_node_id][cur_node_id]
+
+        new_label = BackwardLabel(pre_node_id, revised_cost, routing_time, demand, pre_label=cur_label)
+        new_label.update_reachable_mask(self._cal_backward_reachable_mask(cur_label.reachable_mask, new_label))
+        if self._backward_label_dict[pre_node_id].insert(new_label):
+            self._backward_unprocessed_labels.put_nowait(new_label)
+
+    def label_extension(self, cur_label: Label, out_edge: GraphEdge):
+        """Extend forward label to reachable nodes whose routing time is not larger than the midpoint."""
+        next_node = self.graph.node_list[out_edge.to_]
+        routing_time = cur_label.routing_time + next_node.service_time + out_edge.routing_time
+        if max(routing_time, next_node.earliest_time) > self.midpoint:
+            return
+        super().label_extension(cur_label, out_edge)
+
+    def _cal_reachable_mask(self, pre_label_reachable_mask: int, new_label: Label) -> int:
+        """Calculate forward reachable nodes set.
+
+        Note that, the sink node is only reached by joining. The midpoint is not applied here but in
+        label_extension, since the reachable node set is compared in dominance, where a node past the midpoint is
+        still reachable by the join with a backward label.
+        """
+        next_node_id = new_label.graph_node_id
+        reachable_mask = pre_label_reachable_mask & ~(1 << next_node_id) & ~(1 << (self.graph.node_num - 1))
+        reachable_mask &= ~self._infeasible_masks[next_node_id]
+        unreachable_mask = 0
+        for to_, to_demand, to_routing_time, to_latest_time in self._successors[next_node_id]:
+            if not (reachable_mask >> to_) & 1:
+                continue
+            routing_time = new_label.routing_time + to_routing_time
+            if new_label.demand + to_demand > self.capacity:
+                unreachable_mask |= 1 << to_
+            elif routing_time > to_latest_time:
+                unreachable_mask |= 1 << to_
+
+        return reachable_mask & ~unreachable_mask
+
+    def _cal_backward_reachable_mask(self, pre_label_reachable_mask: int, new_label: BackwardLabel) -> int:
+        """Calculate backward reachable nodes set.
+
+        Note that, the source node is only reached by joining, and the nodes whose latest routing time would be
+        earlier than the earliest time are unreachable for backward labels. As in _cal_reachable_mask, the midpoint
+        is applied in backward_label_extension instead.
+        """
+        cur_node_id = new_label.graph_node_id
+        cur_node = self.graph.node_list[cur_node_id]
+        reachable_mask = pre_label_reachable_mask & ~(1 << cur_node_id) & ~1
+        latest_time = min(cur_node.latest_time, new_label.routing_time) - cur_node.service_time
+        unreachable_mask = 0
+        for edge in self.reversed_edge_dict[cur_node_id]:
+            from_ = edge.from_
+            if not (reachable_mask >> from_) & 1:
+                continue
+            from_node = self.graph.node_list[from_]
+            routing_time = min(latest_time - edge.routing_time, from_node.latest_time)
+            if new_label.demand + from_node.demand > self.capacity:
+                unreachable_mask |= 1 << from_
+            elif routing_time < from_node.earliest_time:
+                unreachable_mask |= 1 << from_
+
+        return reachable_mask & ~unreachable_mask
+
+    def join(self) -> tuple:
+        """Join forward and backward labels via every edge, and return the best pair of labels.
+
+        Note that, only the paths cheaper than the upper bound are joined, i.e. none with non-negative revised cost in
+        pricing mode.
+
+        """
+        best_cost, best_pair = self._upper_bound, (None, None)
+        backward_label_dict = {}
+        for node_id in range(self.graph.node_num):
+            backward_label_dict[node_id] = sorted(self._backward_label_dict[node_id], key=lambda x: x.revised_cost)
+
+        for node_id in range(self.graph.node_num - 1):
+            for forward_label in self._label_dict[node_id]:
+                forward_visited_mask = forward_label.visited_mask
+                for edge in self._edge_dict[node_id]:
+                    to_node = self.graph.node_list[edge.to_]
+                    routing_time = forward_label.routing_time + to_node.service_time + edge.routing_time
+                    cost = forward_label.revised_cost + self.graph.revised_cost_rows[node_id][edge.to_]
+                    for backward_label in backward_label_dict[edge.to_]:
+                        if cost + backward_label.revised_cost >= best_cost:
+                            break
+                        if forward_label.demand + backward_label.demand > self.capacity:
+                            continue
+                        if routing_time > to_node.latest_time or routing_time > backward_label.routing_time:
+                            continue
+                        if forward_visited_mask & backward_label.visited_mask:
+                            continue
+                        best_cost, best_pair = cost + backward_label.revised_cost, (forward_label, backward_label)
+
+        if best_pair[0] is not None:
+            self.reduced_cost = best_cost
+        return best_pair
+
+    def _init_backward_label_dict(self) -> dict:
+        """Initialize backward label store for every nodes."""
+        return {i: LabelStore(False, self.max_labels_per_node, self.capacity) for i in range(self.graph.node_num)}
+
+    def reset(self):
+        super().reset()
+        self._backward_label_dict = self._init_backward_label_dict()
+        self._backward_unprocessed_labels = HeapLabelQueue()
@@ -0,0 +1,202 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 8:40 AM
+# * Filename      : Checkpoint
+# * Description   :
+# **********************************************************
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from src.graph.Graph import Graph
+from src.labeling.LabelSetting import Label
+
+# Magic number and version of checkpoint file
+MAGIC = b'LSCKPT01'
+# Typecodes of packed arrays
+ARRAY_TYPECODES = {
+    'graph_node_id': 'q',
+    'revised_cost': 'd',
+    'routing_time': 'd',
+    'demand': 'd',
+    'parent': 'q',    # -1 for the label of source node
+    'state': 'B',    # IS_DOMINATED bit
+    'reachable_mask': 'B',    # mask_bytes bytes per label, little endian
+    'store_labels': 'q',    # label indices of every label store, in order of node id and then store order
+    'store_sizes': 'q',    # number of labels of every label store
+    'queue_labels': 'q',    # label indices of queue, see LabelQueue.__iter__
+    'dual_val': 'd',
+}
+IS_DOMINATED = 1
+
+
+class Checkpoint:
+
+    """Class for snapshot of label setting as packed arrays.
+
+    The labels in the label stores and the queue, and their pre labels, are numbered so that a pre label has a
+    smaller index than its labels, and kept as parallel typed arrays as in LabelPool, where the pre_label pointer is
+    replaced by the parent index, and the reachable node set by a fixed number of bytes. The label stores and the
+    queue are kept as arrays of label indices, and the dual value, critical nodes, upper bound, label budget and the
+    nodes whose label stores have dropped labels as meta data, together with a fingerprint of the graph. Whether the
+    time or label budget is exhausted is not kept, since the unprocessed labels are kept and extended by resume.
+    The file is a JSON header followed by the raw arrays, and is written to a temporary file and then renamed, so
+    that a killed job never leaves a corrupted checkpoint.
+
+    Typical usage example:
+
+    checkpoint = Checkpoint.from_label_setting(ls)
+    checkpoint.save('espprc.ckpt')
+    Checkpoint.load('espprc.ckpt').restore(ls)
+
+    """
+
+    def __init__(self, meta: dict, arrays: dict):
+        self.meta = meta
+        self.arrays = arrays
+
+    @classmethod
+    def from_label_setting(cls, label_setting) -> 'Checkpoint':
+        """Take a snapshot of the labels, label stores and queue of label setting."""
+        node_num = label_setting.graph.node_num
+        mask_bytes = (node_num + 7) // 8
+        arrays = {name: array(typecode) for name, typecode in ARRAY_TYPECODES.items()}
+        indices = {}    # key: id of label, value: label index
+
+        def add_label(label) -> int:
+            # Number the pre labels first, so that a pre label has a smaller index
+            chain = []
+            while label is not None and id(label) not in indices:
+                if type(label) is not Label:
+                    raise NotImplementedError(f'Checkpoint of {type(label).__name__} is not supported.')
+                chain.append(label)
+                label = label.pre_label
+            for item in reversed(chain):
+                indices[id(item)] = len(arrays['parent'])
+                arrays['graph_node_id'].append(item.graph_node_id)
+                arrays['revised_cost'].append(item.revised_cost)
+                arrays['routing_time'].append(item.routing_time)
+                arrays['demand'].append(item.demand)
+                arrays['parent'].append(indices[id(item.pre_label)] if item.pre_label is not None else -1)
+                arrays['state'].append(IS_DOMINATED if item.is_dominated else 0)
+                arrays['reachable_mask'].frombytes(item.reachable_mask.to_bytes(mask_bytes, 'little'))
+            return indices[id(chain[0])] if chain else indices[id(label)]
+
+        truncated_nodes = []
+        for node_id in range(node_num):
+            store = label_setting._label_dict[node_id]
+            if store.is_truncated:
+                truncated_nodes.append(node_id)
+            labels = list(store)
+            arrays['store_sizes'].append(len(labels))
+            for label in labels:
+                arrays['store_labels'].append(add_label(label))
+        for label in label_setting._unprocessed_labels:
+            # The dominated labels in queue are skipped by label extension anyway
+            if not label.is_dominated:
+                arrays['queue_labels'].append(add_label(label))
+        arrays['dual_val'].extend(label_setting._dual_val)
+
+        meta = {
+            'solver': type(label_setting).__name__,
+            'node_num': node_num,
+            'capacity': label_setting.capacity,
+            'graph_fingerprint': cls.get_graph_fingerprint(label_setting.graph),
+            'critical_mask': hex(label_setting._critical_mask),
+            'upper_bound': label_setting._upper_bound,
+            'extended_label_num': label_setting._extended_label_num,
+            'truncated_nodes': truncated_nodes,
+            'mask_bytes': mask_bytes,
+            'byteorder': sys.byteorder,
+        }
+        return cls(meta, arrays)
+
+    def restore(self, label_setting):
+        """Restore the labels, label stores and queue into label setting, which has been reset."""
+        self.check(label_setting)
+        meta, arrays = self.meta, self.arrays
+        mask_bytes, reachable_mask = meta['mask_bytes'], arrays['reachable_mask'].tobytes()
+        labels = []
+        for i, (graph_node_id, revised_cost, routing_time, demand, parent, state) in enumerate(zip(
+                arrays['graph_node_id'], arrays['revised_cost'], arrays['routing_time'], arrays['demand'],
+                arrays['parent'], arrays['state'])):
+            label = Label(graph_node_id, revised_cost, routing_time, demand,
+                          pre_label=labels[parent] if parent >= 0 else None)
+            label.update_reachable_mask(int.from_bytes(reachable_mask[i * mask_bytes:(i + 1) * mask_bytes], 'little'))
+            label.is_dominated = bool(state & IS_DOMINATED)
+            labels.append(label)
+
+        # The labels of a store are non-dominated by each other, hence they are inserted in the same order
+        pos = 0
+        for node_id, size in enumerate(arrays['store_sizes']):
+            store = label_setting._label_dict[node_id]
+            for index in arrays['store_labels'][pos:pos + size]:
+                store.insert(labels[index])
+            pos += size
+        # The labels dropped by max_labels_per_node are lost, while the budget is recomputed by the resumed solve
+        for node_id in meta['truncated_nodes']:
+            label_setting._label_dict[node_id].is_truncated = True
+        for index in arrays['queue_labels']:
+            label_setting._unprocessed_labels.put_nowait(labels[index])
+
+        label_setting._critical_mask = int(meta['critical_mask'], 16)
+        label_setting._upper_bound = min(label_setting._upper_bound, meta['upper_bound'])
+        label_setting._extended_label_num = meta['extended_label_num']
+
+    def check(self, label_setting):
+        """Check whether the checkpoint is taken by the same solver on the same graph, otherwise raise ValueError."""
+        meta = self.meta
+        if meta['solver'] != type(label_setting).__name__:
+            raise ValueError(f"The checkpoint is taken by {meta['solver']}, not {type(label_setting).__name__}.")
+        if meta['node_num'] != label_setting.graph.node_num or meta['capacity'] != label_setting.capacity:
+            raise ValueError('The checkpoint is taken with different node number or capacity.')
+        if meta['graph_fingerprint'] != self.get_graph_fingerprint(label_setting.graph):
+            raise ValueError('The checkpoint is taken on a different graph.')
+
+    @property
+    def dual_val(self) -> list:
+        return self.arrays['dual_val'].tolist()
+
+    @staticmethod
+    def get_graph_fingerprint(graph: Graph) -> int:
+        """Get CRC32 of the node data and the edges of graph, including the branching decisions of graph view."""
+        data = array('d')
+        for node in graph.node_list:
+            data.extend((node.demand, node.earliest_time, node.latest_time, node.service_time))
+        for i in range(graph.node_num):
+            for edge in sorted(graph.edge_dict[i], key=lambda x: x.to_):
+                data.extend((i, edge.to_, graph.original_cost_map[i, edge.to_], edge.routing_time))
+        return zlib.crc32(data.tobytes())
+
+    def save(self, path: str):
+        """Save checkpoint as a binary file, i.e. magic, header length, JSON header and raw arrays."""
+        header = dict(self.meta, arrays={name: len(values) for name, values in self.arrays.items()})
+        header_bytes = json.dumps(header).encode()
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header_bytes)))
+            f.write(header_bytes)
+            for name in ARRAY_TYPECODES:
+                self.arrays[name].tofile(f)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint':
+        """Load checkpoint from a binary file saved by save."""
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path} is not a label setting checkpoint.')
+            header_len, = struct.unpack('<Q', f.read(8))
+            meta = json.loads(f.read(header_len))
+            arrays = {}
+            for name, typecode in ARRAY_TYPECODES.items():
+                arrays[name] = array(typecode)
+                arrays[name].fromfile(f, meta['arrays'][name])
+                if meta['byteorder'] != sys.byteorder:
+                    arrays[name].byteswap()
+        del meta['arrays']
+        return cls(meta, arrays)
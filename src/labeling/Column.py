@@ -0,0 +1,28 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 1:40 PM
+# * Filename      : Column
+# * Description   :
+# **********************************************************
+class Column:
+
+    """Class for column generated by pricing, i.e. a path from source node to sink node with its costs.
+
+    Typical usage example:
+
+    column = Column([0, 3, 7, 9], -180.66, 36)
+    print(column)
+
+    """
+
+    def __init__(self, path: list, reduced_cost: float, original_cost: float):
+        self.path = path
+        self.reduced_cost = reduced_cost
+        self.original_cost = original_cost
+
+    def __lt__(self, other):
+        return self.reduced_cost < other.reduced_cost
+
+    def __str__(self):
+        return f'{self.path}, reduced cost = {self.reduced_cost}, original cost = {self.original_cost}'
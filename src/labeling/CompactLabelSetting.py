@@ -0,0 +1,167 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 0:45 AM
+# * Filename      : CompactLabelSetting
+# * Description   :
+# **********************************************************
+from array import array
+from src.graph.Graph import Graph
+from src.labeling.LabelPool import LabelPool, QUEUED, REMOVED
+from src.labeling.LabelQueue import LabelQueue
+from src.labeling.LabelSetting import LabelSetting, Label
+from src.labeling.LabelStore import LabelStore, SinkLabelStore
+
+
+class CompactLabel(Label):
+
+    """Class for label which is kept in a LabelPool by its index.
+
+    Note that, the pre_label of a label is released once it is added to the pool, i.e. its path is kept by the
+    parent indices of the pool, see CompactLabelSetting._get_path.
+    """
+
+    __slots__ = ('index',)
+
+
+class CompactLabelStore(LabelStore):
+
+    """Class for the non-dominated labels of one graph node, which are kept as indices into a LabelPool.
+
+    The buckets are typed arrays of revised costs and indices, and the dominance rule is checked on the pool.
+    """
+
+    def __init__(self, label_pool: LabelPool, flag=False, max_labels=None, capacity=None):
+        super().__init__(flag, max_labels, capacity)
+        self.label_pool = label_pool
+
+    def _get_demand(self, index: int) -> float:
+        return self.label_pool.demand[index]
+
+    def _get_cost(self, index: int) -> float:
+        return self.label_pool.revised_cost[index]
+
+    def _new_bucket(self) -> tuple:
+        return array('d'), array('i')
+
+    def _get_dominate(self, index: int):
+        return self.label_pool.dominate
+
+    def _remove(self, index: int):
+        self.label_pool.remove(index)
+
+    def insert(self, label_2_compare: CompactLabel) -> bool:
+        """Add the label to the pool and insert its index into the store, see LabelStore.insert."""
+        pool, pre_label = self.label_pool, label_2_compare.pre_label
+        index = pool.add(label_2_compare, -1 if pre_label is None else pre_label.index)
+        if not super().insert(index):
+            if not pool.state[index] & REMOVED:
+                pool.remove(index)
+            return False
+        if pool.state[index] & REMOVED:
+            # removed at once since the store is full
+            return False
+        label_2_compare.index, label_2_compare.pre_label = index, None
+        return True
+
+
+class CompactSinkLabelStore(SinkLabelStore):
+
+    """Class for the best labels of the sink node, whose paths are kept by a LabelPool."""
+
+    def __init__(self, label_pool: LabelPool, max_labels=1):
+        super().__init__(max_labels)
+        self.label_pool = label_pool
+
+    def insert(self, label_2_compare: CompactLabel) -> bool:
+        if not super().insert(label_2_compare):
+            return False
+        label_2_compare.index = self.label_pool.add(label_2_compare, label_2_compare.pre_label.index)
+        label_2_compare.pre_label = None
+        return True
+
+    def _remove(self, label: CompactLabel):
+        label.is_dominated = True
+        self.label_pool.remove(label.index)
+
+
+class CompactLabelQueue(LabelQueue):
+
+    """Class for queue of unprocessed labels, whose reachable node sets are kept by a LabelPool while queued.
+
+    The labels removed from the label stores while queued are marked as dominated when they are got.
+    """
+
+    def __init__(self, label_pool: LabelPool, label_queue: LabelQueue):
+        self.label_pool = label_pool
+        self._queue = label_queue
+
+    def put_nowait(self, label: CompactLabel):
+        self.label_pool.state[label.index] |= QUEUED
+        label.reachable_mask = 0
+        self._queue.put_nowait(label)
+
+    def get_nowait(self) -> CompactLabel:
+        label, pool = self._queue.get_nowait(), self.label_pool
+        index = label.index
+        pool.state[index] &= ~QUEUED
+        if pool.state[index] & REMOVED:
+            label.is_dominated = True
+            if not pool.child_num[index]:
+                pool.release(index)
+        else:
+            label.reachable_mask = pool.get_mask(index)
+        return label
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+
+class CompactLabelSetting(LabelSetting):
+
+    """Class for label setting algorithm with compact label storage.
+
+    The labels are kept in a LabelPool rather than as Label objects, i.e. the label stores only keep label indices
+    and revised costs as typed arrays, the queued labels keep their reachable node sets in the pool, and the removed
+    labels are recycled by the pool. Hence, a stored label takes LabelPool.bytes_per_label bytes plus 12 bytes in
+    its store, e.g. 66 bytes for 100 nodes. The extension, dominance, label selection, budget and status of solve
+    are the same as LabelSetting, except that checkpoint is not supported.
+
+    Typical usage example:
+
+    ls = CompactLabelSetting(graph_)
+    ls.solve(dual_val)
+    print(len(ls.label_pool), ls.label_pool.capacity)
+
+    """
+
+    label_class = CompactLabel
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, **kwargs):
+        self.label_pool = LabelPool(graph.node_num)
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+
+    def reset(self):
+        self.label_pool.clear()
+        super().reset()
+
+    def _check_checkpoint_support(self):
+        raise NotImplementedError(f'Checkpoint of {type(self).__name__} is not supported.')
+
+    def _get_path(self, label: CompactLabel) -> list:
+        return self.label_pool.get_visited_nodes(label.index)
+
+    def _init_label_queue(self) -> CompactLabelQueue:
+        return CompactLabelQueue(self.label_pool, super()._init_label_queue())
+
+    def _init_label_dict(self) -> dict:
+        """Initialize label store for every nodes on the label pool, where the sink node keeps the best labels."""
+        sink = self.graph.node_num - 1
+        return {
+            i: CompactSinkLabelStore(self.label_pool, self.max_columns) if i == sink else
+            CompactLabelStore(self.label_pool, False, self.max_labels_per_node, self.capacity)
+            for i in range(self.graph.node_num)
+        }
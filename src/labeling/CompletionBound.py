@@ -0,0 +1,57 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:50 PM
+# * Filename      : CompletionBound
+# * Description   :
+# **********************************************************
+import numpy as np
+from src.graph.Graph import Graph
+
+
+class CompletionBound:
+
+    """Class for lower bounds on the revised cost from every node to the sink node.
+
+    The bound is computed by a backward dynamic programming over the integer demand levels, where elementarity and
+    time windows are relaxed, i.e. bound[i][q] is the minimal revised cost of a (not necessarily elementary) path
+    from node i to the sink node, given that demand q has been consumed when arriving at node i. Since every node
+    with incoming edges except the sink node has a demand not smaller than 1, every edge moves to a larger demand
+    level, hence there is no negative cycle. Otherwise, the bound is invalid and is not used.
+
+    Typical usage example:
+
+    completion_bound = CompletionBound(graph_, edge_dict_, capacity)
+    bound = completion_bound.compute(dual_val)
+    print(bound[node_id][int(demand)])
+
+    """
+
+    def __init__(self, graph: Graph, edge_dict: dict, capacity: float):
+        n = graph.node_num
+        sink = n - 1
+        self.node_num = n
+        self.level_num = int(capacity) + 1
+        self.original_cost = np.full((n, n), np.inf)
+        for i in range(n):
+            for edge in edge_dict[i]:
+                self.original_cost[i, edge.to_] = graph.original_cost_map[i, edge.to_]
+        demand = np.array([node.demand for node in graph.node_list], dtype=float)
+        has_incoming_edge = np.isfinite(self.original_cost).any(axis=0)
+        has_incoming_edge[sink] = False
+        self.is_valid = bool(np.all(demand[has_incoming_edge] >= 1))
+        self._demand_shift = np.floor(np.maximum(demand, 0)).astype(np.int64)
+        self._sink = sink
+
+    def compute(self, dual_val: list) -> list:
+        """Compute bound rows, i.e. bound[node_id][demand level], for the dual value."""
+        n, level_num = self.node_num, self.level_num
+        revised_cost = self.original_cost - np.asarray(dual_val, dtype=float)[:, None]
+        # The demand levels beyond capacity are padded with inf
+        bound = np.full((n, level_num + int(self._demand_shift.max()) + 1), np.inf)
+        bound[self._sink, :level_num] = 0
+        node_index = np.arange(n)
+        for level in range(level_num - 1, -1, -1):
+            next_bound = bound[node_index, level + self._demand_shift]
+            np.minimum(bound[:, level], (revised_cost + next_bound[None, :]).min(axis=1), out=bound[:, level])
+        return bound[:, :level_num].tolist()
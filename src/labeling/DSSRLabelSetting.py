@@ -0,0 +1,79 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:20 AM
+# * Filename      : DSSRLabelSetting
+# * Description   :
+# **********************************************************
+from src.graph.Graph import Graph
+from src.labeling.LabelSetting import LabelSetting
+
+
+class DSSRLabelSetting(LabelSetting):
+
+    """Class for label setting algorithm with decremental state space relaxation (DSSR).
+
+    Elementarity is only enforced on a set of critical nodes, which is empty at the beginning. The relaxed problem
+    is solved by the ordinary label setting algorithm, and the nodes visited more than once by the optimal path are
+    added to the critical node set, until the optimal path is elementary. The critical node set is kept between
+    calls of solve, since the cycling nodes are usually similar for similar dual values.
+
+    Note that, every cycle is required to consume a positive amount of demand or routing time, otherwise the
+    relaxed problem may have infinitely many labels.
+
+    Righini, G., & Salani, M. (2008). New dynamic programming algorithms for the resource constrained elementary
+    shortest path problem. Networks, 51(3), 155-170.
+
+    Typical usage example:
+
+    ls = DSSRLabelSetting(graph_)
+    ls.solve(dual_val)
+    print(ls.critical_nodes)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, critical_nodes=None, **kwargs):
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+        # The source node is always critical
+        self._critical_mask = 1
+        for node_id in critical_nodes or []:
+            self._critical_mask |= 1 << node_id
+        self.iteration_num = 0    # number of relaxed problems solved by the last call of solve
+
+    @property
+    def critical_nodes(self) -> list:
+        """Get critical node set."""
+        return [i for i in range(self.graph.node_num) if (self._critical_mask >> i) & 1]
+
+    def solve(self, dual_val: list):
+        """Solve a elementary shortest path problem via DSSR.
+
+        Note that, the budget is shared by all the relaxed problems, and if it is exhausted, the elementary path
+        found by the last relaxed problem is reported if any.
+        """
+        self.iteration_num = 0
+        super()._start_budget()
+        while True:
+            self.iteration_num += 1
+            super().solve(dual_val)
+            if self.status == 'infeasible':
+                # No path in the relaxed problem, or no path with negative reduced cost in pricing mode
+                return
+            # Check whether the optimal path is elementary, and only the elementary paths are reported as columns
+            sink_labels = list(self._label_dict[self.graph.node_num - 1])
+            if sink_labels[0].is_elementary or self.status == 'truncated':
+                columns = [self._get_column(label) for label in sink_labels if label.is_elementary]
+                if columns:
+                    self._set_columns(columns)
+                else:
+                    self.reduced_cost, self.shortest_path, self.original_cost, self.columns = 0, [], 0, []
+                return
+            # Add the nodes visited more than once by the paths better than any elementary path to critical node set
+            for label in sink_labels:
+                if label.is_elementary:
+                    break
+                self._critical_mask |= label.repeated_mask
+
+    def _start_budget(self):
+        # The budget is started once by solve for all the relaxed problems
+        pass
@@ -0,0 +1,144 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 7:20 AM
+# * Filename      : FleetLabelSetting
+# * Description   :
+# **********************************************************
+from src.graph.Graph import Graph
+from src.labeling.Column import Column
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.LabelStore import SinkLabelStore
+
+
+class FleetSinkLabelStore:
+
+    """Class for the incumbents of the sink node for every vehicle type.
+
+    A sink label is offered to the incumbent of every vehicle type whose capacity is not smaller than its demand, and
+    in pricing mode, only if its reduced cost for the vehicle type, i.e. revised cost plus the offset of the type, is
+    negative. The bound is the largest revised cost that a sink label has to be smaller than to improve any type.
+
+    """
+
+    def __init__(self, capacities: list, offsets: list, pricing_mode=False):
+        self.capacities = capacities
+        self.stores = [SinkLabelStore() for _ in capacities]
+        self._limits = [-offset if pricing_mode else float('inf') for offset in offsets]
+        self.is_truncated = False
+
+    @property
+    def bound(self) -> float:
+        return max(min(store.bound, limit) for store, limit in zip(self.stores, self._limits))
+
+    @property
+    def compare_num(self) -> int:
+        return sum(store.compare_num for store in self.stores)
+
+    @property
+    def remove_num(self) -> int:
+        return sum(store.remove_num for store in self.stores)
+
+    def insert(self, label_2_compare) -> bool:
+        """Insert a label into the incumbents, and return whether it is the incumbent of any vehicle type."""
+        is_inserted = False
+        demand, revised_cost = label_2_compare.demand, label_2_compare.revised_cost
+        for capacity, limit, store in zip(self.capacities, self._limits, self.stores):
+            if demand <= capacity and revised_cost < limit and store.insert(label_2_compare):
+                is_inserted = True
+        return is_inserted
+
+    def _get_labels(self) -> list:
+        """Get the distinct incumbents sorted by revised cost."""
+        labels = {id(label): label for store in self.stores for label in store}
+        return sorted(labels.values(), key=lambda label: label.revised_cost)
+
+    def __len__(self):
+        return len(self._get_labels())
+
+    def __iter__(self):
+        return iter(self._get_labels())
+
+    def __getitem__(self, index: int):
+        return self._get_labels()[index]
+
+
+class FleetLabelSetting(LabelSetting):
+
+    """Class for label setting algorithm for several vehicle types in one pass.
+
+    The vehicle types differ only in capacity and fixed cost, i.e. vehicle_types is a list of (capacity, fixed cost).
+    The labeling runs once with the largest capacity, where a label is feasible for every vehicle type whose capacity
+    is not smaller than its demand. Since a label only dominates the labels with not smaller demand, it is feasible
+    for all the vehicle types of the dominated labels, hence the labels needed by every vehicle type are kept, and
+    the best path of every vehicle type is taken from the sink labels, see FleetSinkLabelStore.
+
+    The reduced cost of a path for a vehicle type is the revised cost plus the fixed cost minus the dual value of the
+    vehicle type if given, e.g. of its fleet size constraint, and the original cost includes the fixed cost. After
+    solve, columns[k] is the column of vehicle_types[k], or None if no path is found for it, and shortest_path is
+    the path with the smallest reduced cost over all the vehicle types. The capacity of labeling is the largest
+    vehicle capacity, and capacity is only checked against it if given, e.g. by BatchPricing.
+
+    Typical usage example:
+
+    ls = FleetLabelSetting(graph_, vehicle_types=[(100, 0), (200, 50)])
+    ls.solve(dual_val, vehicle_dual_val=[10, 20])
+    for column in ls.columns:
+        print(column)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, vehicle_types=((100, 0),), capacity=None,
+                 **kwargs):
+        if not vehicle_types:
+            raise ValueError('At least one vehicle type is required.')
+        if kwargs.get('max_columns', 1) > 1:
+            raise ValueError(f'Multiple columns per vehicle type of {type(self).__name__} are not supported.')
+        self.vehicle_types = [(vehicle_capacity, fixed_cost) for vehicle_capacity, fixed_cost in vehicle_types]
+        self._offsets = [fixed_cost for _, fixed_cost in self.vehicle_types]
+        max_capacity = max(vehicle_capacity for vehicle_capacity, _ in self.vehicle_types)
+        if capacity is not None and capacity < max_capacity:
+            raise ValueError(f'The capacity {capacity} is smaller than the largest vehicle capacity {max_capacity}.')
+        capacity = max_capacity
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+        self.columns = []
+
+    def solve(self, dual_val: list, vehicle_dual_val=None):
+        """Solve the elementary shortest path problems of all the vehicle types via one labeling pass."""
+        vehicle_dual_val = vehicle_dual_val or [0] * len(self.vehicle_types)
+        self._offsets = [fixed_cost - dual for (_, fixed_cost), dual in zip(self.vehicle_types, vehicle_dual_val)]
+        super().solve(dual_val)
+
+        self.columns = []
+        for (_, fixed_cost), offset, store in zip(self.vehicle_types, self._offsets,
+                                                  self._label_dict[self.graph.node_num - 1].stores):
+            if not len(store):
+                self.columns.append(None)
+                continue
+            path = store[0].get_visited_nodes()
+            self.columns.append(
+                Column(path, store[0].revised_cost + offset, self.graph.get_original_cost(path) + fixed_cost)
+            )
+        found_columns = [column for column in self.columns if column is not None]
+        if found_columns:
+            best_column = min(found_columns)
+            self.reduced_cost = best_column.reduced_cost
+            self.shortest_path = best_column.path
+            self.original_cost = best_column.original_cost
+
+    def _revise_cost(self, dual_val: list):
+        super()._revise_cost(dual_val)
+        # The initial upper bound is the largest revised cost that can improve any vehicle type
+        self._upper_bound = self._label_dict[self.graph.node_num - 1].bound
+
+    def _init_label_dict(self) -> dict:
+        """Initialize label store for every nodes, where the sink node keeps the incumbent of every vehicle type."""
+        label_dict = super()._init_label_dict()
+        label_dict[self.graph.node_num - 1] = FleetSinkLabelStore(
+            [capacity for capacity, _ in self.vehicle_types], self._offsets, self.pricing_mode
+        )
+        return label_dict
+
+    def reset(self):
+        super().reset()
+        self.columns = []
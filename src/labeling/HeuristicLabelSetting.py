@@ -0,0 +1,99 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 1:40 PM
+# * Filename      : HeuristicLabelSetting
+# * Description   :
+# **********************************************************
+from src.graph.Graph import Graph
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.LabelStore import LabelStore, SinkLabelStore
+
+
+class HeuristicLabelStore(LabelStore):
+
+    """Class for the labels of one graph node in heuristic pricing.
+
+    A label only dominates other label by routing time and revised cost, hence all the labels are kept in one
+    bucket, and at most max_labels labels with the smallest revised cost are kept. The counters and truncation are
+    the same as LabelStore. The sink node keeps the best max_columns labels, see SinkLabelStore.
+
+    """
+
+    def _get_bucket_key(self, label):
+        return 0
+
+    def _get_dominate(self, label):
+        return self._dominate
+
+    @staticmethod
+    def _dominate(label, other, flag=False) -> bool:
+        """Check whether label dominates other label by routing time and revised cost only."""
+        return label.revised_cost <= other.revised_cost and label.routing_time <= other.routing_time
+
+
+class HeuristicLabelSetting(LabelSetting):
+
+    """Class for heuristic label setting algorithm for pricing.
+
+    Labels are only compared by revised cost and routing time, at most max_labels_per_node labels are kept for
+    every node, and the labeling stops as soon as max_columns sink labels with negative revised cost are found.
+    The sink labels with non-negative revised cost are rejected even if pricing_mode is False, and the found paths
+    are reported as columns, sorted by reduced cost. Since the result is not guaranteed to be optimal, the status is
+    'truncated' if any column is found, otherwise 'infeasible', and the exact LabelSetting should be used to prove
+    that no negative column exists.
+
+    Typical usage example:
+
+    ls = HeuristicLabelSetting(graph_, max_labels_per_node=10, max_columns=20)
+    ls.solve(dual_val)
+    for column in ls.columns:
+        print(column)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100,
+                 max_labels_per_node=None, max_columns=10, **kwargs):
+        super().__init__(graph, branch_arc, branch_value, capacity, max_labels_per_node=max_labels_per_node,
+                         max_columns=max_columns, **kwargs)
+
+    def solve(self, dual_val: list):
+        """Solve a elementary shortest path problem heuristically, and collect negative columns."""
+        self.reset()
+        self._start_budget()
+        self._revise_cost(dual_val)
+        self._init_source_label()
+        self._process_labels()
+
+        columns = [self._get_column(label) for label in self._label_dict[self.graph.node_num - 1]]
+        self.status = 'truncated' if columns else 'infeasible'
+        if columns:
+            self._set_columns(columns)
+
+    def _revise_cost(self, dual_val: list):
+        super()._revise_cost(dual_val)
+        # Only the columns with negative reduced cost are collected, as in pricing_mode
+        self._upper_bound = min(self._upper_bound, 0)
+
+    def _process_labels(self):
+        """Extend the unprocessed labels until the queue is empty, enough columns are found or budget is exhausted."""
+        sink_labels, has_budget = self._label_dict[self.graph.node_num - 1], self._has_budget()
+        while not self._unprocessed_labels.empty():
+            if sink_labels.bound < 0:
+                # max_columns sink labels with negative revised cost are found
+                break
+            cur_label = self._unprocessed_labels.get_nowait()
+            if cur_label.is_dominated:
+                continue
+            if has_budget and self._is_budget_exhausted():
+                break
+            for edge in self._edge_dict[cur_label.graph_node_id]:
+                self.label_extension(cur_label, edge)
+
+    def _init_label_dict(self) -> dict:
+        """Initialize label store for every nodes, where the sink node keeps the best max_columns labels."""
+        sink = self.graph.node_num - 1
+        return {
+            i: SinkLabelStore(self.max_columns) if i == sink else
+            HeuristicLabelStore(False, self.max_labels_per_node) for i in range(self.graph.node_num)
+        }
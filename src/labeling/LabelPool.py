@@ -0,0 +1,142 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 0:30 AM
+# * Filename      : LabelPool
+# * Description   :
+# **********************************************************
+from array import array
+
+# States of label in the pool
+QUEUED = 1
+REMOVED = 2
+
+
+class LabelPool:
+
+    """Class for compact storage of labels as parallel typed arrays.
+
+    A label is an index into the pool, and its graph node id, revised cost, routing time, demand, parent index and
+    number of reachable nodes are kept in typed arrays, while the reachable node set is packed into a bytearray with
+    a fixed width of (node_num + 7) // 8 bytes per label. The index of the parent label replaces the pre_label
+    pointer, and the number of children of every label is counted, so that a removed label is recycled, i.e. its
+    index is reused by a new label, as soon as it is neither queued nor the parent of any label. The parent of a
+    recycled label is recycled as well if it is removed and has no other children.
+
+    Typical usage example:
+
+    pool = LabelPool(graph_.node_num)
+    index = pool.add(label, parent)
+    print(pool.get_visited_nodes(index), pool.bytes_per_label)
+
+    """
+
+    def __init__(self, node_num: int):
+        self.node_num = node_num
+        self.mask_width = (node_num + 7) // 8
+        self.graph_node_id = array('i')
+        self.revised_cost = array('d')
+        self.routing_time = array('d')
+        self.demand = array('d')
+        self.parent = array('i')    # -1 for the label of source node
+        self.child_num = array('i')
+        self.reachable_nodes_num = array('i')
+        self.state = bytearray()    # QUEUED and REMOVED bits
+        self.masks = bytearray()    # reachable node set, little endian, mask_width bytes per label
+        self._free = []    # indices of recycled labels
+
+    @property
+    def bytes_per_label(self) -> int:
+        """Number of bytes of a label in the pool."""
+        arrays = (self.graph_node_id, self.revised_cost, self.routing_time, self.demand, self.parent,
+                  self.child_num, self.reachable_nodes_num)
+        return sum(a.itemsize for a in arrays) + 1 + self.mask_width
+
+    def add(self, label, parent: int) -> int:
+        """Add a label to the pool, and return its index."""
+        mask = label.reachable_mask.to_bytes(self.mask_width, 'little')
+        if self._free:
+            index = self._free.pop()
+            self.graph_node_id[index] = label.graph_node_id
+            self.revised_cost[index] = label.revised_cost
+            self.routing_time[index] = label.routing_time
+            self.demand[index] = label.demand
+            self.parent[index] = parent
+            self.child_num[index] = 0
+            self.reachable_nodes_num[index] = label.reachable_nodes_num
+            self.state[index] = 0
+            self.masks[index * self.mask_width:(index + 1) * self.mask_width] = mask
+        else:
+            index = len(self.parent)
+            self.graph_node_id.append(label.graph_node_id)
+            self.revised_cost.append(label.revised_cost)
+            self.routing_time.append(label.routing_time)
+            self.demand.append(label.demand)
+            self.parent.append(parent)
+            self.child_num.append(0)
+            self.reachable_nodes_num.append(label.reachable_nodes_num)
+            self.state.append(0)
+            self.masks += mask
+        if parent >= 0:
+            self.child_num[parent] += 1
+        return index
+
+    def get_mask(self, index: int) -> int:
+        """Get the reachable node set of the label as an integer bitmask."""
+        return int.from_bytes(self.masks[index * self.mask_width:(index + 1) * self.mask_width], 'little')
+
+    def dominate(self, index: int, other: int, flag=False) -> bool:
+        """Check whether the label can dominate other label, see Label.dominate."""
+        revised_cost = self.revised_cost
+        if flag:
+            return revised_cost[index] < revised_cost[other]
+        demand, routing_time, reachable_nodes_num = self.demand, self.routing_time, self.reachable_nodes_num
+        if (demand[index] > demand[other] or revised_cost[index] > revised_cost[other] or
+                routing_time[index] > routing_time[other]):
+            return False
+        if reachable_nodes_num[index] < reachable_nodes_num[other]:
+            return False
+        masks, width = self.masks, self.mask_width
+        start, other_start = index * width, other * width
+        return not (int.from_bytes(masks[other_start:other_start + width], 'little') &
+                    ~int.from_bytes(masks[start:start + width], 'little'))
+
+    def remove(self, index: int):
+        """Mark the label as removed, and recycle it if it is neither queued nor the parent of any label."""
+        self.state[index] |= REMOVED
+        if self.state[index] == REMOVED and not self.child_num[index]:
+            self.release(index)
+
+    def release(self, index: int):
+        """Recycle the label, and its removed ancestors which have no other children."""
+        while True:
+            self.state[index] = REMOVED
+            self._free.append(index)
+            parent = self.parent[index]
+            if parent < 0:
+                return
+            self.child_num[parent] -= 1
+            if self.child_num[parent] or self.state[parent] != REMOVED:
+                return
+            index = parent
+
+    def get_visited_nodes(self, index: int) -> list:
+        """Get visited nodes of the label by walking the parent indices."""
+        node_list = []
+        while index >= 0:
+            node_list.append(self.graph_node_id[index])
+            index = self.parent[index]
+        node_list.reverse()
+        return node_list
+
+    def clear(self):
+        """Remove all the labels."""
+        self.__init__(self.node_num)
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated labels, including the recycled ones."""
+        return len(self.parent)
+
+    def __len__(self):
+        return len(self.parent) - len(self._free)
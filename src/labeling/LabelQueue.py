@@ -0,0 +1,165 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 7:15 PM
+# * Filename      : LabelQueue
+# * Description   :
+# **********************************************************
+from collections import deque
+from heapq import heappush, heappop
+
+
+class LabelQueue:
+
+    """Class for queue of unprocessed labels.
+
+    The queue has the same put_nowait, get_nowait and empty methods as queue.PriorityQueue, but it is not thread
+    safe and therefore takes no lock. The order of label selection is decided by the subclasses. The labels are
+    iterated in such an order that putting them into an empty queue restores the queue, e.g. for checkpoint.
+
+    Typical usage example:
+
+    queue = create_label_queue('time')
+    queue.put_nowait(label)
+    label = queue.get_nowait()
+
+    """
+
+    def put_nowait(self, label):
+        raise NotImplementedError
+
+    def get_nowait(self):
+        raise NotImplementedError
+
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __iter__(self):
+        raise NotImplementedError
+
+
+class HeapLabelQueue(LabelQueue):
+
+    """Class for label queue ordered lexicographically by revised cost, routing time and demand.
+
+    Note that, the keys are precomputed tuples, and ties are broken by insertion order.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._count = 0
+
+    def put_nowait(self, label):
+        self._count += 1
+        heappush(self._heap, (label.revised_cost, label.routing_time, label.demand, self._count, label))
+
+    def get_nowait(self):
+        return heappop(self._heap)[-1]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return (item[-1] for item in sorted(self._heap, key=lambda item: item[:-1]))
+
+
+class BucketLabelQueue(LabelQueue):
+
+    """Class for label queue ordered by routing time buckets.
+
+    Since the routing time is non-decreasing along the extension, the labels are processed in the monotone order
+    of the routing time, which is the classic order of label setting algorithm. Labels in the same bucket are
+    processed by insertion order.
+    """
+
+    def __init__(self, bucket_width=1):
+        self.bucket_width = bucket_width
+        self._buckets = {}    # key: bucket index, value: deque of labels
+        self._bucket_heap = []
+        self._size = 0
+
+    def put_nowait(self, label):
+        index = int(label.routing_time // self.bucket_width)
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            bucket = self._buckets[index] = deque()
+            heappush(self._bucket_heap, index)
+        bucket.append(label)
+        self._size += 1
+
+    def get_nowait(self):
+        index = self._bucket_heap[0]
+        bucket = self._buckets[index]
+        label = bucket.popleft()
+        if not bucket:
+            heappop(self._bucket_heap)
+            del self._buckets[index]
+        self._size -= 1
+        return label
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for index in sorted(self._buckets):
+            yield from self._buckets[index]
+
+
+class FIFOLabelQueue(LabelQueue):
+
+    """Class for first-in-first-out label queue, i.e. breadth first label selection."""
+
+    def __init__(self):
+        self._queue = deque()
+
+    def put_nowait(self, label):
+        self._queue.append(label)
+
+    def get_nowait(self):
+        return self._queue.popleft()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+
+class LIFOLabelQueue(LabelQueue):
+
+    """Class for last-in-first-out label queue, i.e. depth first label selection."""
+
+    def __init__(self):
+        self._queue = []
+
+    def put_nowait(self, label):
+        self._queue.append(label)
+
+    def get_nowait(self):
+        return self._queue.pop()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+
+LABEL_QUEUES = {
+    'cost': HeapLabelQueue,
+    'time': BucketLabelQueue,
+    'fifo': FIFOLabelQueue,
+    'lifo': LIFOLabelQueue,
+}
+
+
+def create_label_queue(label_selection='cost') -> LabelQueue:
+    """Create label queue by label selection strategy, which is one of LABEL_QUEUES or a LabelQueue class."""
+    if isinstance(label_selection, str):
+        if label_selection not in LABEL_QUEUES:
+            raise ValueError(f"Unknown label selection {label_selection}, which should be one of {list(LABEL_QUEUES)}.")
+        return LABEL_QUEUES[label_selection]()
+    return label_selection()
@@ -4,10 +4,14 @@
 # * Create time   : 2023/1/16 9:41 AM
 # * Filename      : LabelSetting
 # **********************************************************
-from queue import PriorityQueue
-from copy import deepcopy
+from time import perf_counter
 from src.graph.Graph import Graph
 from src.graph.GraphEdge import GraphEdge
+from src.labeling.Column import Column
+from src.labeling.LabelQueue import create_label_queue
+from src.labeling.LabelStore import LabelStore, SinkLabelStore
+from src.labeling.SolveStatistics import SolveStatistics
+from src.util.Utils import BitView, list_to_mask, mask_to_list
 
 
 class Label:
@@ -24,8 +28,17 @@ class Label:
 
     https://github.com/xiongwq16/exact-algorithm/blob/master/src/vrptw/algorithm/subproblem/labelalgorithm/SpptwccViaLabelSetting.java
 
+    The identity of the path, i.e. the visited node set and the nodes visited more than once as bitmasks, and a hash
+    of the node sequence, is computed from the identity of pre_label at the first access and then cached, so that
+    the equality of labels and the elementarity of path are checked in amortized O(1) without any overhead of label
+    extension, and the path is only materialized by get_visited_nodes when it is reported.
+
     """
 
+    # No instance dict, which saves memory when there are millions of labels, see also CompactLabelSetting
+    __slots__ = ('graph_node_id', 'revised_cost', 'routing_time', 'demand', 'pre_label', 'reachable_mask',
+                 'reachable_nodes_num', 'is_dominated', '_identity')
+
     def __init__(self,
                  graph_node_id: int,
                  revised_cost: float,
@@ -37,8 +50,14 @@ class Label:
         self.routing_time = routing_time
         self.demand = demand
         self.pre_label = pre_label
-        self.is_node_reachable = []
+        self.reachable_mask = 0    # bit i is set iff node i is reachable
         self.reachable_nodes_num = 0
+        self.is_dominated = False
+
+    @property
+    def is_node_reachable(self) -> BitView:
+        """Compatibility view of the reachable node set, e.g. label.is_node_reachable[i]."""
+        return BitView(self.reachable_mask)
 
     def dominate(self, other, flag=False) -> bool:
         """Check whether can dominate other label.
@@ -62,9 +81,8 @@ class Label:
         if self.reachable_nodes_num < other.reachable_nodes_num:
             return False
         # If there exists unreachable nodes that other label can reach, then it cannot dominate other.
-        for i in range(len(self.is_node_reachable)):
-            if (not self.is_node_reachable[i]) and other.is_node_reachable[i]:
-                return False
+        if other.reachable_mask & ~self.reachable_mask:
+            return False
 
         return True
 
@@ -80,46 +98,71 @@ class Label:
         return node_list
 
     def update_reachable_nodes(self, reachable_nodes: list):
-        """Update reachable node set."""
-        self.is_node_reachable = reachable_nodes[:]
-        for item in reachable_nodes:
-            if item:
-                self.reachable_nodes_num += 1
+        """Update reachable node set from a list of booleans."""
+        self.update_reachable_mask(list_to_mask(reachable_nodes))
+
+    def update_reachable_mask(self, reachable_mask: int):
+        """Update reachable node set from an integer bitmask."""
+        self.reachable_mask = reachable_mask
+        self.reachable_nodes_num = reachable_mask.bit_count()
+
+    def _get_identity(self) -> tuple:
+        """Get (visited mask, repeated mask, path hash), where the identities of pre labels are cached as well."""
+        try:
+            return self._identity
+        except AttributeError:
+            pass
+        # Walk the pre_label chain up to the first label with cached identity, and then compute back down
+        labels, identity, cur_label = [], (0, 0, 0), self
+        while cur_label is not None:
+            try:
+                identity = cur_label._identity
+                break
+            except AttributeError:
+                labels.append(cur_label)
+                cur_label = cur_label.pre_label
+        visited_mask, repeated_mask, path_hash = identity
+        for label in reversed(labels):
+            node_bit = 1 << label.graph_node_id
+            repeated_mask |= visited_mask & node_bit
+            visited_mask |= node_bit
+            path_hash = hash((path_hash, label.graph_node_id))
+            label._identity = (visited_mask, repeated_mask, path_hash)
+        return self._identity
+
+    @property
+    def visited_mask(self) -> int:
+        """Bitmask of visited nodes."""
+        return self._get_identity()[0]
+
+    @property
+    def repeated_mask(self) -> int:
+        """Bitmask of nodes visited more than once."""
+        return self._get_identity()[1]
+
+    @property
+    def path_hash(self) -> int:
+        """Hash of the sequence of visited nodes."""
+        return self._get_identity()[2]
+
+    @property
+    def is_elementary(self) -> bool:
+        """Whether no node is visited more than once."""
+        return not self.repeated_mask
 
     def __eq__(self, other):
-        if self.graph_node_id != other.graph_node_id:
-            return False
-        if self.demand != other.demand:
-            return False
-        if self.routing_time != other.routing_time:
-            return False
-        cur_label_1, cur_label_2 = self, other
-        while cur_label_1.pre_label is not None:
-            if cur_label_2 is None:
-                return False
-            if cur_label_1.graph_node_id != cur_label_2.graph_node_id:
-                return False
-            cur_label_1 = cur_label_1.pre_label
-            cur_label_2 = cur_label_2.pre_label
-
-        if cur_label_2.pre_label is not None:
-            return False
+        # The paths are the same iff the visited node sets and the hashes of node sequences are the same, where the
+        # probability of hash collision is negligible, hence the pre_label chains are not walked.
+        return (self.graph_node_id == other.graph_node_id and self.demand == other.demand and
+                self.routing_time == other.routing_time and self._get_identity() == other._get_identity())
 
-        return True
+    def __hash__(self):
+        return self.path_hash
 
     def __lt__(self, other):
-        if self.revised_cost < other.revised_cost:
-            return True
-        if self.revised_cost >= other.revised_cost:
-            return False
-        if self.routing_time < other.routing_time:
-            return True
-        if self.routing_time >= other.routing_time:
-            return False
-        if self.demand < other.demand:
-            return True
-        if self.demand >= other.demand:
-            return False
+        # lexicographic order of revised cost, routing time and demand
+        return ((self.revised_cost, self.routing_time, self.demand) <
+                (other.revised_cost, other.routing_time, other.demand))
 
 
 class LabelSetting:
@@ -131,52 +174,259 @@ class LabelSetting:
     ls = LabelSetting(graph_)
     ls.solve()
 
+    Note that, the graph is not copied, the label setting works on a view of the graph (see Graph.get_view),
+    where the branching decisions, i.e. branch_arc and branch_value, and a list of (branch_arc, branch_value)
+    given by branch_decisions, are applied. The order of label selection is decided by label_selection, which is
+    'cost' (default), 'time', 'fifo', 'lifo' or a LabelQueue class, see LabelQueue. The sink node only keeps the
+    best max_columns sink labels, i.e. the incumbent by default, and the worst of them rejects the worse sink labels
+    at once, see SinkLabelStore. After solve, columns are the paths of the kept sink labels sorted by reduced cost,
+    where the first one is the shortest path. Note that, the other columns are the best ones found rather than the
+    best ones of all paths, since the labels dominated by the labels of the columns are dropped.
+
+    If completion_bound is True, the labels whose revised cost plus the lower bound of the completion to the sink
+    node (see CompletionBound, which requires NumPy) is not smaller than the best sink label are dropped. In
+    pricing_mode, the labels whose completion cannot be negative are dropped as well, and solve reports no path
+    if there exists no path with negative reduced cost.
+
+    If statistics is True or a SolveStatistics, the statistics of the last solve, e.g. the number of labels
+    generated and dominated and the time of the hot path methods, are collected in self.statistics, see
+    SolveStatistics. Otherwise, self.statistics is None and there is no overhead.
+
+    The solve is budgeted by time_limit (seconds), max_labels, i.e. the maximal number of labels to extend, and
+    max_labels_per_node, i.e. if a label store is full, the label with the largest revised cost is dropped. After
+    solve, status is 'optimal', 'truncated' if any budget is exhausted, where the best path found so far is reported,
+    or 'infeasible' if no path is found (or no path with negative reduced cost in pricing_mode).
+
+    If checkpoint_path and checkpoint_interval (seconds) are given, the labels, label stores and queue are saved to
+    checkpoint_path as packed arrays every checkpoint_interval seconds during solve, see Checkpoint, and an
+    interrupted solve is continued by resume(checkpoint_path) with a label setting of the same graph and arguments.
+    Note that, checkpoint is only supported by the label settings which keep Label objects and the solve of
+    LabelSetting, e.g. VectorizedLabelSetting, and the time limit is restarted by resume.
+
     """
 
-    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100):
-        self.graph = deepcopy(graph)
-        self.capacity = capacity
-        if branch_arc is not None:
-            self.graph.revise_dist_map(branch_arc, branch_value)
+    label_class = Label    # class of the new labels, which can be overridden for other label representations
 
-        self._unprocessed_labels = PriorityQueue()
-        self._label_dict = {i: [] for i in range(self.graph.node_num)}    # label list for every nodes
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, branch_decisions=None,
+                 label_selection='cost', completion_bound=False, pricing_mode=False, statistics=False,
+                 time_limit=None, max_labels=None, max_labels_per_node=None, checkpoint_path=None,
+                 checkpoint_interval=None, max_columns=1):
+        branch_decisions = list(branch_decisions or [])
+        if branch_arc is not None:
+            branch_decisions.insert(0, (branch_arc, branch_value))
+        self.graph = graph.get_view(branch_decisions)
+        self.capacity = capacity
+        self.label_selection = label_selection
+        self.completion_bound = completion_bound
+        self.pricing_mode = pricing_mode
+        self.time_limit = time_limit
+        self.max_labels = max_labels
+        self.max_labels_per_node = max_labels_per_node
+        self.max_columns = max_columns
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        if checkpoint_path is not None:
+            self._check_checkpoint_support()
+
+        self._unprocessed_labels = self._init_label_queue()
+        self._label_dict = self._init_label_dict()    # label store for every nodes
+        self._critical_mask = (1 << self.graph.node_num) - 1    # nodes that are not allowed to be visited twice
+        self._bound_rows = None    # lower bound of completion, i.e. bound_rows[node_id][demand level]
+        self._upper_bound = float('inf')
+        self._deadline = None
+        self._checkpoint_time = None
+        self._extended_label_num = 0
+        self._is_truncated = False
+        self._dual_val = None
+        self.refresh()
         # Solution info
         self.reduced_cost = 0
         self.shortest_path = []
         self.original_cost = 0
+        self.columns = []
+        self.status = None
+
+        self.statistics = None
+        if statistics:
+            self.statistics = statistics if isinstance(statistics, SolveStatistics) else SolveStatistics()
+            self._instrument()
 
     def solve(self, dual_val: list):
         """Solve a elementary shortest path problem via labeling-4-espprc approach."""
         # Note that, we should reset properties first
         self.reset()
+        self._start_budget()
         # Revise cost map
-        self.graph.revise_cost_map(dual_val)
+        self._revise_cost(dual_val)
         # Start from source node
-        init_label = Label(0, 0, 0, 0)
-        reachable_nodes = self._cal_reachable_nodes([True for _ in range(self.graph.node_num)], init_label)
-        init_label.update_reachable_nodes(reachable_nodes)
-        self._label_dict[0].append(init_label)
+        self._init_source_label()
+        self._process_labels()
+        self._set_solution()
+
+    def resume(self, checkpoint_path: str):
+        """Resume the solve from a checkpoint saved by save_checkpoint, and get the solution as solve."""
+        from src.labeling.Checkpoint import Checkpoint
+        self._check_checkpoint_support()
+        checkpoint = Checkpoint.load(checkpoint_path)
+        checkpoint.check(self)
+        self.reset()
+        self._start_budget()
+        self._revise_cost(checkpoint.dual_val)
+        checkpoint.restore(self)
+        self._process_labels()
+        self._set_solution()
+
+    def save_checkpoint(self, checkpoint_path: str):
+        """Save the labels, label stores and queue of the running solve, see Checkpoint."""
+        from src.labeling.Checkpoint import Checkpoint
+        self._check_checkpoint_support()
+        Checkpoint.from_label_setting(self).save(checkpoint_path)
+
+    def _start_checkpoint(self) -> bool:
+        """Start the checkpoint timer of _process_labels, and return whether checkpoint is enabled."""
+        self._checkpoint_time = None
+        if self.checkpoint_path is not None and self.checkpoint_interval is not None:
+            self._checkpoint_time = perf_counter() + self.checkpoint_interval
+        return self._checkpoint_time is not None
+
+    def _save_checkpoint_if_due(self):
+        """Save checkpoint if checkpoint_interval has elapsed.
+
+        Note that, this method should be called by every _process_labels between labels, i.e. when all the
+        unprocessed labels are in queue.
+        """
+        if perf_counter() >= self._checkpoint_time:
+            self.save_checkpoint(self.checkpoint_path)
+            self._checkpoint_time = perf_counter() + self.checkpoint_interval
+
+    def _check_checkpoint_support(self):
+        if type(self).solve is not LabelSetting.solve:
+            raise NotImplementedError(f'Checkpoint of {type(self).__name__} is not supported.')
+
+    def _set_solution(self):
+        """Get optimal shortest path, or the best one found so far if truncated."""
+        is_truncated = self._is_truncated or any(store.is_truncated for store in self._label_dict.values())
+        if not self._label_dict[self.graph.node_num - 1]:
+            self.status = 'truncated' if is_truncated else 'infeasible'
+            return
+        self.status = 'truncated' if is_truncated else 'optimal'
+        self._set_columns([self._get_column(label) for label in self._label_dict[self.graph.node_num - 1]])
+
+    def _set_columns(self, columns: list):
+        """Set the columns sorted by reduced cost, and the shortest path by the first one."""
+        self.columns = columns
+        self.reduced_cost = columns[0].reduced_cost
+        self.shortest_path = columns[0].path
+        self.original_cost = columns[0].original_cost
+
+    def _get_column(self, label: Label) -> Column:
+        """Get the column of a sink label."""
+        path = self._get_path(label)
+        return Column(path, label.revised_cost, self.graph.get_original_cost(path))
+
+    def _get_path(self, label: Label) -> list:
+        """Get the visited nodes of the label."""
+        return label.get_visited_nodes()
+
+    def _start_budget(self):
+        """Start the time and label budget of solve."""
+        self._deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        self._extended_label_num = 0
+        self._is_truncated = False
+
+    def _has_budget(self) -> bool:
+        """Check whether the solve is budgeted by time or labels."""
+        return self._deadline is not None or self.max_labels is not None
+
+    def _is_budget_exhausted(self) -> bool:
+        """Check whether the time or label budget is exhausted, otherwise count a label to extend."""
+        if (self._deadline is not None and perf_counter() > self._deadline) or (
+                self.max_labels is not None and self._extended_label_num >= self.max_labels):
+            self._is_truncated = True
+            return True
+        self._extended_label_num += 1
+        return False
+
+    def refresh(self):
+        """Precompute the dual-independent data that is kept between calls of solve.
+
+        Note that, this method should be called again if the graph of label setting has been revised.
+        """
+        node_list, unreachable_masks = self.graph.node_list, self.graph.unreachable_masks
+        self._edge_dict, self._successors, self._infeasible_masks = {}, {}, {}
+        for i in range(self.graph.node_num):
+            # The demand and routing time at node i are not smaller than its demand and earliest time
+            min_demand = node_list[i].demand if i != 0 else 0
+            min_routing_time = node_list[i].earliest_time if i != 0 else 0
+            edges, successors, infeasible_mask = [], [], 0
+            for edge in self.graph.edge_dict[i]:
+                to_node = node_list[edge.to_]
+                if min_demand + to_node.demand > self.capacity:
+                    infeasible_mask |= 1 << edge.to_
+                    continue
+                if min_routing_time + to_node.service_time + edge.routing_time > to_node.latest_time:
+                    infeasible_mask |= 1 << edge.to_
+                    continue
+                edges.append(edge)
+                successors.append(
+                    (edge.to_, to_node.demand, to_node.service_time + edge.routing_time, to_node.latest_time)
+                )
+            self._edge_dict[i] = edges    # feasible outgoing edges
+            self._successors[i] = successors    # (to_, demand, service time plus routing time, latest time)
+            if unreachable_masks is not None:
+                infeasible_mask |= unreachable_masks[i]
+            self._infeasible_masks[i] = infeasible_mask    # nodes which are never reachable from node i
+        self._source_reachable_mask = None
+
+        self._completion_bound = None
+        if self.completion_bound:
+            # NumPy is only required when completion bound is used
+            from src.labeling.CompletionBound import CompletionBound
+            completion_bound = CompletionBound(self.graph, self._edge_dict, self.capacity)
+            if completion_bound.is_valid:
+                self._completion_bound = completion_bound
+
+    def _revise_cost(self, dual_val: list):
+        """Revise cost map, and compute the lower bound of completion and the initial upper bound."""
+        self._dual_val = list(dual_val)
+        self.graph.revise_cost_map(dual_val)
+        self._bound_rows = self._completion_bound.compute(dual_val) if self._completion_bound is not None else None
+        self._upper_bound = 0 if self.pricing_mode else float('inf')
+
+    def _init_source_label(self):
+        """Put the label of source node into queue."""
+        init_label = self.label_class(0, 0, 0, 0)
+        if self._source_reachable_mask is None:
+            self._source_reachable_mask = self._cal_reachable_mask((1 << self.graph.node_num) - 1, init_label)
+        init_label.update_reachable_mask(self._source_reachable_mask)
+        self._label_dict[0].insert(init_label)
         self._unprocessed_labels.put_nowait(init_label)
 
+    def _process_labels(self):
+        """Extend the unprocessed labels until the queue is empty or the budget is exhausted."""
+        has_budget, has_checkpoint = self._has_budget(), self._start_checkpoint()
         while not self._unprocessed_labels.empty():
-            # Get lexico-graphically minimal label and remove it from queue
+            if has_checkpoint:
+                self._save_checkpoint_if_due()
+            # Get the next label by label selection strategy and remove it from queue
             cur_label = self._unprocessed_labels.get_nowait()
+            # Skip the label if it has been dominated after it was put into queue
+            if cur_label.is_dominated:
+                continue
+            if has_budget and self._is_budget_exhausted():
+                # Put the label back, so that it is kept by checkpoint and extended by resume
+                self._unprocessed_labels.put_nowait(cur_label)
+                break
             cur_graph_node_id = cur_label.graph_node_id
             # Extension and Dominance
-            for edge in self.graph.edge_dict[cur_graph_node_id]:
+            for edge in self._edge_dict[cur_graph_node_id]:
                 self.label_extension(cur_label, edge)
 
-        # Get optimal shortest path
-        self.reduced_cost = self._label_dict[self.graph.node_num - 1][0].revised_cost
-        self.shortest_path = self._label_dict[self.graph.node_num - 1][0].get_visited_nodes()
-        self.original_cost = self.graph.get_original_cost(self.shortest_path)
-
     def label_extension(self, cur_label: Label, out_edge: GraphEdge):
         """Extend label to reachable nodes."""
         cur_node_id, next_node_id = cur_label.graph_node_id, out_edge.to_
 
-        if not cur_label.is_node_reachable[next_node_id]:
+        if not (cur_label.reachable_mask >> next_node_id) & 1:
             return
 
         demand = cur_label.demand + self.graph.node_list[next_node_id].demand
@@ -186,74 +436,125 @@ class LabelSetting:
         if routing_time < self.graph.node_list[next_node_id].earliest_time:
             routing_time = self.graph.node_list[next_node_id].earliest_time
 
-        revised_cost = cur_label.revised_cost + self.graph.revised_cost_map[cur_node_id, next_node_id]
-        new_label = Label(next_node_id, revised_cost, routing_time, demand, pre_label=cur_label)
-        new_label.update_reachable_nodes(self._cal_reachable_nodes(cur_label.is_node_reachable, new_label))
+        revised_cost = cur_label.revised_cost + self.graph.revised_cost_rows[cur_node_id][next_node_id]
+        new_label = self.label_class(next_node_id, revised_cost, routing_time, demand, pre_label=cur_label)
+        new_label.update_reachable_mask(self._cal_reachable_mask(cur_label.reachable_mask, new_label))
 
         # Use dominance rule to check whether can be dominated by other labels
         self.dominance(new_label)
 
     def _cal_reachable_nodes(self, pre_label_reachable_nodes: list, new_label: Label) -> list:
-        """Calculate reachable nodes set."""
+        """Calculate reachable nodes set as a list of booleans, which is kept for compatibility."""
+        reachable_mask = self._cal_reachable_mask(list_to_mask(pre_label_reachable_nodes), new_label)
+        return mask_to_list(reachable_mask, len(pre_label_reachable_nodes))
+
+    def _cal_reachable_mask(self, pre_label_reachable_mask: int, new_label: Label) -> int:
+        """Calculate reachable nodes set as an integer bitmask."""
         next_node_id = new_label.graph_node_id
         # Cal reachable nodes set
         # Note that, since the routing time and demand are non-decreasing,
         # the unreachable nodes of last label must be unreachable for the
-        # current node.
-        reachable_nodes = pre_label_reachable_nodes[:]
-        # set the current node as unreachable
-        reachable_nodes[next_node_id] = False
+        # current node, and the current node is set as unreachable if it is critical.
+        reachable_mask = pre_label_reachable_mask & ~((1 << next_node_id) & self._critical_mask)
+        reachable_mask &= ~self._infeasible_masks[next_node_id]
         # Check the reachable node of last label whether still reachable.
-        for edge in self.graph.edge_dict[next_node_id]:
-            to_ = edge.to_
-            if not reachable_nodes[to_]:
+        unreachable_mask = 0
+        demand, routing_time, capacity = new_label.demand, new_label.routing_time, self.capacity
+        for to_, to_demand, to_routing_time, to_latest_time in self._successors[next_node_id]:
+            if not (reachable_mask >> to_) & 1:
                 continue
-            demand = new_label.demand + self.graph.node_list[to_].demand
-            if demand > self.capacity:
-                reachable_nodes[to_] = False
-            routing_time = new_label.routing_time + self.graph.node_list[to_].service_time + edge.routing_time
-            if routing_time > self.graph.node_list[to_].latest_time:
-                reachable_nodes[to_] = False
+            if demand + to_demand > capacity or routing_time + to_routing_time > to_latest_time:
+                unreachable_mask |= 1 << to_
 
-        return reachable_nodes
+        return reachable_mask & ~unreachable_mask
 
     def dominance(self, label_2_compare: Label):
         """Use basic dominance rule."""
         cur_node_id = label_2_compare.graph_node_id
-        processed_labels = self._label_dict[cur_node_id]
-
-        is_possible_dominated_by_next_label = True
-        dominance_flag = True if (cur_node_id == self.graph.node_num - 1) else False
-
-        # compare with all the processed labels
-        temp, is_dominated = [], False
-        for item in processed_labels:
-            if label_2_compare.dominate(item, dominance_flag):
-                # skip if they are equal
-                if is_possible_dominated_by_next_label and label_2_compare == item:
-                    return
-                # if the current label can dominate one label, then the other label in the processed labels list
-                # can not dominate the current label
-                is_possible_dominated_by_next_label = False
-            else:
-                temp.append(item)
-
-            if is_possible_dominated_by_next_label and item.dominate(label_2_compare, dominance_flag):
-                is_dominated = True
-                break
-
-        if not is_dominated:
-            temp.append(label_2_compare)
-            if cur_node_id != self.graph.node_num - 1:
-                self._unprocessed_labels.put_nowait(label_2_compare)
-
-        self._label_dict[cur_node_id] = temp
+        if cur_node_id == self.graph.node_num - 1:
+            # the sink label is rejected at once if it cannot improve the incumbent, see SinkLabelStore
+            if label_2_compare.revised_cost >= self._upper_bound:
+                return
+            if self._label_dict[cur_node_id].insert(label_2_compare):
+                self._update_upper_bound(label_2_compare)
+            return
+        # drop the label if its best completion cannot be better than the upper bound
+        if self._bound_rows is not None:
+            bound = self._bound_rows[cur_node_id][int(label_2_compare.demand)]
+            if label_2_compare.revised_cost + bound >= self._upper_bound:
+                return
+        # compare with the processed labels, and the dominated labels are removed from the label store
+        if self._label_dict[cur_node_id].insert(label_2_compare):
+            self._unprocessed_labels.put_nowait(label_2_compare)
+
+    def _update_upper_bound(self, sink_label: Label):
+        """Update upper bound by the bound of sink label store, i.e. the incumbent or the worst of top labels."""
+        bound = self._label_dict[sink_label.graph_node_id].bound
+        if bound < self._upper_bound:
+            self._upper_bound = bound
+
+    def _init_label_queue(self):
+        """Initialize the queue of unprocessed labels by label selection strategy."""
+        return create_label_queue(self.label_selection)
+
+    def _init_label_dict(self) -> dict:
+        """Initialize label store for every nodes, where the sink node only keeps the best max_columns labels."""
+        sink = self.graph.node_num - 1
+        return {
+            i: SinkLabelStore(self.max_columns) if i == sink else
+            LabelStore(False, self.max_labels_per_node, self.capacity)
+            for i in range(self.graph.node_num)
+        }
+
+    def _instrument(self):
+        """Wrap the hot path methods of the instance to collect statistics."""
+        statistics, label_dict, sink = self.statistics, lambda: self._label_dict, self.graph.node_num - 1
+        label_extension = statistics.timed('label_extension', self.label_extension)
+        dominance = statistics.timed('dominance', self.dominance)
+        self._cal_reachable_mask = statistics.timed('_cal_reachable_mask', self._cal_reachable_mask)
+        last_label = [None]
+
+        def counted_label_extension(cur_label: Label, out_edge: GraphEdge):
+            if cur_label is not last_label[0]:
+                last_label[0] = cur_label
+                statistics.labels_extended += 1
+            if not (cur_label.reachable_mask >> out_edge.to_) & 1:
+                statistics.extensions_pruned_by_reachability += 1
+            label_extension(cur_label, out_edge)
+
+        def counted_dominance(label_2_compare: Label):
+            store = label_dict()[label_2_compare.graph_node_id]
+            compare_num, remove_num, label_num = store.compare_num, store.remove_num, len(store)
+            dominance(label_2_compare)
+            removed_num = store.remove_num - remove_num
+            statistics.labels_generated += 1
+            statistics.labels_removed += removed_num
+            statistics.dominance_comparisons += store.compare_num - compare_num
+            if len(store) - label_num + removed_num:
+                statistics.labels_inserted += 1
+            elif label_2_compare.graph_node_id == sink:
+                # the sink label is rejected by the incumbent, either at once or by the sink label store
+                statistics.labels_rejected_by_incumbent += 1
+            elif store.compare_num != compare_num:
+                statistics.labels_rejected += 1
+            if len(self._unprocessed_labels) > statistics.queue_high_water:
+                statistics.queue_high_water = len(self._unprocessed_labels)
+            if statistics.labels_generated % statistics.sample_interval == 0:
+                statistics.sample(label_dict())
+
+        self.label_extension = counted_label_extension
+        self.dominance = counted_dominance
 
     def reset(self):
         # reset properties
         self.reduced_cost = 0
         self.shortest_path = []
-        self._label_dict = {i: [] for i in range(self.graph.node_num)}
-        self._unprocessed_labels = PriorityQueue()
+        self.original_cost = 0
+        self.columns = []
+        self.status = None
+        self._label_dict = self._init_label_dict()
+        self._unprocessed_labels = self._init_label_queue()
+        if self.statistics is not None:
+            self.statistics.reset()
 
 
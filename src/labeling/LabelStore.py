@@ -0,0 +1,225 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 9:12 AM
+# * Filename      : LabelStore
+# * Description   :
+# **********************************************************
+from bisect import bisect_left, bisect_right, insort
+from heapq import heappush, heappop
+
+# Number of demand buckets of a store if capacity is given, i.e. the bucket width is capacity / DEMAND_BUCKET_NUM
+DEMAND_BUCKET_NUM = 32
+
+
+class LabelStore:
+
+    """Class for the non-dominated labels of one graph node.
+
+    Labels are kept in buckets by demand, and every bucket is sorted by revised cost. Since a label can only be
+    dominated by labels whose demand and revised cost are not larger, and can only dominate labels whose demand and
+    revised cost are not smaller, a new label is only compared with the cost prefixes of the buckets with not
+    larger demand for being dominated, and with the cost suffixes of the buckets with not smaller demand for
+    dominating, and the store is updated in place. The bucket width is capacity / DEMAND_BUCKET_NUM if capacity is
+    given, otherwise every demand value has its own bucket, and all the labels are in one bucket for the sink node.
+
+    If max_labels is given and the store is full, the label with the largest revised cost is removed, and the store
+    is marked as truncated, since the removed label is not dominated.
+
+    The bucket key, demand, revised cost and dominance rule of a label, the removal of a dominated label and the
+    bucket type are hooks, i.e. _get_bucket_key, _get_demand, _get_cost, _get_dominate, _remove and _new_bucket,
+    which can be overridden for other label representations or dominance rules.
+
+    Typical usage example:
+
+    store = LabelStore(capacity=200)
+    if store.insert(label):
+        queue.put_nowait(label)
+
+    """
+
+    def __init__(self, flag=False, max_labels=None, capacity=None):
+        self.flag = flag    # whether it is sink node or not
+        self.max_labels = max_labels
+        self.is_truncated = False
+        self._bucket_width = capacity / DEMAND_BUCKET_NUM if capacity else None
+        self._buckets = {}    # bucket key -> (sorted revised costs, labels)
+        self._bucket_keys = []    # sorted
+        self._size = 0
+        self.compare_num = 0    # number of dominance comparisons
+        self.remove_num = 0    # number of labels removed since dominated by the inserted labels
+
+    def _get_bucket_key(self, label):
+        if self.flag:
+            return 0
+        if self._bucket_width is None:
+            return self._get_demand(label)
+        return int(self._get_demand(label) // self._bucket_width)
+
+    def _get_demand(self, label) -> float:
+        return label.demand
+
+    def _get_cost(self, label) -> float:
+        return label.revised_cost
+
+    def _new_bucket(self) -> tuple:
+        """Create an empty bucket, i.e. (sorted revised costs, labels)."""
+        return [], []
+
+    def _get_dominate(self, label):
+        """Get the dominance rule, i.e. dominate(label, other, flag), see Label.dominate."""
+        return type(label).dominate
+
+    def _remove(self, label):
+        """Mark the label removed from the store as dominated."""
+        label.is_dominated = True
+
+    def insert(self, label_2_compare) -> bool:
+        """Insert a label into the store.
+
+        Note that, the labels dominated by the inserted label are removed from the store and marked as dominated.
+
+        Args:
+            label_2_compare: new label
+
+        Returns: whether the label is non-dominated and has been inserted.
+
+        """
+        key, cost, flag = self._get_bucket_key(label_2_compare), self._get_cost(label_2_compare), self.flag
+        dominate = self._get_dominate(label_2_compare)
+        buckets, bucket_keys = self._buckets, self._bucket_keys
+        # Check whether the label is dominated by the labels with not larger demand and revised cost.
+        for i in range(bisect_right(bucket_keys, key)):
+            costs, labels = buckets[bucket_keys[i]]
+            if costs[0] > cost:
+                continue
+            hi = bisect_right(costs, cost)
+            for j in range(hi):
+                if dominate(labels[j], label_2_compare, flag):
+                    self.compare_num += j + 1
+                    return False
+            self.compare_num += hi
+        # Remove the labels with not smaller demand and revised cost which are dominated by the label.
+        emptied_keys = []
+        for i in range(bisect_left(bucket_keys, key), len(bucket_keys)):
+            costs, labels = buckets[bucket_keys[i]]
+            if costs[-1] < cost:
+                continue
+            lo = bisect_left(costs, cost)
+            self.compare_num += len(labels) - lo
+            dominated = [j for j in range(lo, len(labels)) if dominate(label_2_compare, labels[j], flag)]
+            if not dominated:
+                continue
+            for j in reversed(dominated):
+                self._remove(labels[j])
+                del costs[j]
+                del labels[j]
+            self._size -= len(dominated)
+            self.remove_num += len(dominated)
+            if not labels:
+                emptied_keys.append(bucket_keys[i])
+        for bucket_key in emptied_keys:
+            del buckets[bucket_key]
+            bucket_keys.remove(bucket_key)
+        # Labels with equal revised cost keep their insertion order.
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = self._new_bucket()
+            insort(bucket_keys, key)
+        costs, labels = bucket
+        pos = bisect_right(costs, cost)
+        costs.insert(pos, cost)
+        labels.insert(pos, label_2_compare)
+        self._size += 1
+        if self.max_labels is not None and self._size > self.max_labels:
+            # Remove the label with the largest revised cost
+            self.is_truncated = True
+            self.remove_num += 1
+            worst_key = max(bucket_keys, key=lambda k: buckets[k][0][-1])
+            costs, labels = buckets[worst_key]
+            costs.pop()
+            worst = labels.pop()
+            self._remove(worst)
+            self._size -= 1
+            if not labels:
+                del buckets[worst_key]
+                bucket_keys.remove(worst_key)
+            return worst is not label_2_compare
+        return True
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for bucket_key in self._bucket_keys:
+            yield from self._buckets[bucket_key][1]
+
+    def __getitem__(self, index: int):
+        return list(self)[index]
+
+
+class SinkLabelStore:
+
+    """Class for the best labels of the sink node, i.e. the incumbent.
+
+    At most max_labels labels with the smallest revised cost (the first found one wins a tie) are kept in a max-heap
+    by revised cost, i.e. only the incumbent by default, or the top max_labels labels if more than one column is
+    wanted. A new label is rejected in O(1) if the store is full and its revised cost is not smaller than the bound,
+    i.e. the largest revised cost in the store, and otherwise inserted in O(log max_labels). The labels are iterated
+    in order of revised cost. If max_labels is None, all the sink labels are kept.
+
+    Typical usage example:
+
+    store = SinkLabelStore(max_labels=10)
+    if store.insert(label):
+        upper_bound = min(upper_bound, store.bound)
+
+    """
+
+    def __init__(self, max_labels=1):
+        self.max_labels = max_labels
+        self.is_truncated = False    # the dropped labels are worse than the kept ones, hence never truncated
+        self._heap = []    # (-revised cost, -insertion count, label)
+        self._count = 0
+        self._sorted_labels = []
+        self.compare_num = 0    # number of dominance comparisons
+        self.remove_num = 0    # number of labels removed since worse than the inserted labels
+
+    @property
+    def bound(self) -> float:
+        """Revised cost which a new label has to be smaller than, i.e. the largest revised cost if full, or inf."""
+        if self.max_labels is None or len(self._heap) < self.max_labels:
+            return float('inf')
+        return -self._heap[0][0]
+
+    def insert(self, label_2_compare) -> bool:
+        """Insert a label into the store, and return whether the label has been inserted."""
+        self.compare_num += 1
+        heap = self._heap
+        if self.max_labels is not None and len(heap) >= self.max_labels and label_2_compare.revised_cost >= -heap[0][0]:
+            return False
+        self._count += 1
+        heappush(heap, (-label_2_compare.revised_cost, -self._count, label_2_compare))
+        if self.max_labels is not None and len(heap) > self.max_labels:
+            self._remove(heappop(heap)[2])
+            self.remove_num += 1
+        self._sorted_labels = None
+        return True
+
+    def _remove(self, label):
+        """Mark the label removed from the store as dominated."""
+        label.is_dominated = True
+
+    def _get_sorted_labels(self) -> list:
+        if self._sorted_labels is None:
+            self._sorted_labels = [item[2] for item in sorted(self._heap, reverse=True)]
+        return self._sorted_labels
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return iter(self._get_sorted_labels())
+
+    def __getitem__(self, index: int):
+        return self._get_sorted_labels()[index]
@@ -0,0 +1,280 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:40 PM
+# * Filename      : ParallelLabelSetting
+# * Description   :
+# **********************************************************
+import os
+import traceback
+from multiprocessing import Pipe, Process
+from time import perf_counter
+from src.graph.Graph import Graph
+from src.labeling.LabelSetting import LabelSetting, Label
+
+# Names of the counters reported by the workers every round, see SolveStatistics
+_COUNTER_NAMES = ('labels_generated', 'labels_extended', 'labels_inserted', 'labels_rejected', 'labels_removed',
+                  'labels_rejected_by_incumbent', 'dominance_comparisons')
+
+
+class _PartitionLabel(Label):
+
+    """Class for label in the worker process, which knows its index in the worker and the reference to its parent.
+
+    The reference to a label is (worker id, index), or None for the parent of the source label.
+    """
+
+    __slots__ = ('index', 'parent_ref')
+
+
+class _PartitionWorker(LabelSetting):
+
+    """Class for the label setting of one worker process, which owns the label stores of a partition of the nodes.
+
+    In every round, the labels received for the owned nodes are checked by the dominance rule on the owned label
+    stores, and then at most max_labels unprocessed labels are extended. The new labels are not checked, but sent to
+    the workers which own their nodes, or to the coordinator if they are at the sink node.
+    """
+
+    def __init__(self, graph: Graph, worker_id: int, processes: int, **kwargs):
+        super().__init__(graph, **kwargs)
+        self.worker_id = worker_id
+        self.processes = processes
+        self._extended_labels = {}    # key: index, value: label, i.e. the labels which may be parents
+        self._label_num = 0
+        self._cur_ref = None
+        self._outboxes = []
+        self._counters = dict.fromkeys(_COUNTER_NAMES, 0)
+
+    def start(self, dual_val: list):
+        """Start a solve with dual value."""
+        self.reset()
+        self._revise_cost(dual_val)
+        self._extended_labels = {}
+        self._label_num = 0
+
+    def run_round(self, labels: list, upper_bound: float, max_labels, time_limit) -> tuple:
+        """Check the received labels, and extend at most max_labels labels.
+
+        Args:
+            labels: list of (graph_node_id, revised_cost, routing_time, demand, reachable_mask, parent_ref)
+            upper_bound: revised cost of the incumbent, i.e. the best sink label
+            max_labels: maximal number of labels to extend
+            time_limit: seconds to extend labels, or None
+
+        Returns: (new labels for every worker and then for the coordinator, i.e. the sink labels, number of
+            unprocessed labels, counters, whether any label store is truncated).
+
+        """
+        self._upper_bound = min(self._upper_bound, upper_bound)
+        self._counters = counters = dict.fromkeys(_COUNTER_NAMES, 0)
+        for graph_node_id, revised_cost, routing_time, demand, reachable_mask, parent_ref in labels:
+            label = _PartitionLabel(graph_node_id, revised_cost, routing_time, demand)
+            label.update_reachable_mask(reachable_mask)
+            label.index, label.parent_ref = self._label_num, parent_ref
+            self._label_num += 1
+            if parent_ref is None:
+                # the source label is not counted, as in LabelSetting._init_source_label
+                super().dominance(label)
+                continue
+            store = self._label_dict[graph_node_id]
+            compare_num, remove_num, label_num = store.compare_num, store.remove_num, len(store)
+            super().dominance(label)
+            removed_num = store.remove_num - remove_num
+            counters['labels_removed'] += removed_num
+            counters['dominance_comparisons'] += store.compare_num - compare_num
+            if len(store) - label_num + removed_num:
+                counters['labels_inserted'] += 1
+            elif store.compare_num != compare_num:
+                counters['labels_rejected'] += 1
+
+        self._outboxes = [[] for _ in range(self.processes + 1)]    # the last one is for the coordinator
+        deadline = perf_counter() + time_limit if time_limit is not None else None
+        while not self._unprocessed_labels.empty():
+            cur_label = self._unprocessed_labels.get_nowait()
+            if cur_label.is_dominated:
+                continue
+            if (max_labels is not None and counters['labels_extended'] >= max_labels) or (
+                    deadline is not None and perf_counter() > deadline):
+                self._unprocessed_labels.put_nowait(cur_label)
+                break
+            counters['labels_extended'] += 1
+            self._extended_labels[cur_label.index] = cur_label
+            self._cur_ref = (self.worker_id, cur_label.index)
+            for edge in self._edge_dict[cur_label.graph_node_id]:
+                self.label_extension(cur_label, edge)
+        is_truncated = any(store.is_truncated for store in self._label_dict.values())
+        return self._outboxes, len(self._unprocessed_labels), counters, is_truncated
+
+    def dominance(self, label_2_compare: Label):
+        """Send the new label to the worker which owns its node, or to the coordinator if it is at the sink node."""
+        graph_node_id = label_2_compare.graph_node_id
+        if graph_node_id == self.graph.node_num - 1:
+            # the sink label is counted by the coordinator, unless it is rejected by the incumbent at once
+            if label_2_compare.revised_cost >= self._upper_bound:
+                self._counters['labels_generated'] += 1
+                self._counters['labels_rejected_by_incumbent'] += 1
+                return
+            owner = self.processes
+        else:
+            self._counters['labels_generated'] += 1
+            owner = graph_node_id % self.processes
+        self._outboxes[owner].append((graph_node_id, label_2_compare.revised_cost, label_2_compare.routing_time,
+                                      label_2_compare.demand, label_2_compare.reachable_mask, self._cur_ref))
+
+    def get_label(self, index: int) -> tuple:
+        """Get (graph_node_id, revised_cost, routing_time, demand, parent_ref) of an extended label."""
+        label = self._extended_labels[index]
+        return label.graph_node_id, label.revised_cost, label.routing_time, label.demand, label.parent_ref
+
+
+def _run_worker(conn, graph: Graph, worker_id: int, processes: int, solver_kwargs: dict):
+    """Run the worker process, which answers the commands of the coordinator until it is closed."""
+    worker = _PartitionWorker(graph, worker_id, processes, **solver_kwargs)
+    while True:
+        command, args = conn.recv()
+        if command == 'close':
+            return
+        try:
+            conn.send((True, getattr(worker, command)(*args)))
+        except Exception:
+            conn.send((False, traceback.format_exc()))
+
+
+class ParallelLabelSetting(LabelSetting):
+
+    """Class for label setting algorithm with partitioned label stores on worker processes.
+
+    The nodes are partitioned by graph node id over the worker processes, i.e. node i is owned by worker
+    i % processes, and every worker keeps the label stores and the unprocessed labels of its nodes, while the
+    coordinator only keeps the sink labels and the incumbent. In every round, every worker checks the labels
+    received for its nodes by the dominance rule, extends at most batch_size of its unprocessed labels, and sends
+    the new labels to their owners, while the coordinator collects the sink labels and broadcasts the incumbent,
+    which prunes the sink labels and the completion bound in the next round. The rounds end when no label is sent
+    and no label is unprocessed. Since the labels are extended in batches rather than one by one, the number of labels
+    generated differs from the sequential solve, but the optimal reduced cost is the same.
+
+    The path of a sink label is collected from the workers by the references of parent labels. The budget is
+    checked by the coordinator between rounds, and split over the workers within a round. Checkpoint is not
+    supported, since the label stores are kept by the workers. If processes is 1, the sequential solve is used.
+
+    Note that, the worker processes are kept between calls of solve until close is called.
+
+    Typical usage example:
+
+    with ParallelLabelSetting(graph_, processes=4) as ls:
+        ls.solve(dual_val)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, processes=None,
+                 batch_size=256, **kwargs):
+        self.processes = processes or os.cpu_count()
+        self.batch_size = batch_size
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+        self._graph = graph
+        self._solver_kwargs = {
+            'capacity': capacity,
+            'branch_decisions': self.graph.branch_decisions,
+            'label_selection': self.label_selection,
+            'completion_bound': self.completion_bound,
+            'max_labels_per_node': self.max_labels_per_node
+        }
+        self._workers = []
+
+    def _check_checkpoint_support(self):
+        raise NotImplementedError(f'Checkpoint of {type(self).__name__} is not supported.')
+
+    def _process_labels(self):
+        """Run rounds on the worker processes until no label is sent and no label is unprocessed."""
+        if self.processes <= 1:
+            super()._process_labels()
+            return
+        workers, sink = self._get_workers(), self.graph.node_num - 1
+        for worker in workers:
+            worker.send(('start', (self._dual_val,)))
+        self._receive(workers)
+        # Send the source label to its owner
+        source_label = self._unprocessed_labels.get_nowait()
+        inboxes = [[] for _ in workers]
+        inboxes[0].append((0, 0, 0, 0, source_label.reachable_mask, None))
+        unprocessed_nums = [0] * len(workers)
+        while any(inboxes) or any(unprocessed_nums):
+            max_labels, time_limit = self._get_round_budget()
+            if max_labels == 0 or time_limit == 0:
+                self._is_truncated = True
+                break
+            for worker, inbox in zip(workers, inboxes):
+                worker.send(('run_round', (inbox, self._upper_bound, max_labels, time_limit)))
+            inboxes = [[] for _ in workers]
+            for worker_id, (outboxes, unprocessed_num, counters, is_truncated) in enumerate(self._receive(workers)):
+                for owner, outbox in enumerate(outboxes[:-1]):
+                    inboxes[owner].extend(outbox)
+                for graph_node_id, revised_cost, routing_time, demand, reachable_mask, parent_ref in outboxes[-1]:
+                    sink_label = _PartitionLabel(sink, revised_cost, routing_time, demand)
+                    sink_label.update_reachable_mask(reachable_mask)
+                    sink_label.parent_ref = parent_ref
+                    self.dominance(sink_label)
+                unprocessed_nums[worker_id] = unprocessed_num
+                self._extended_label_num += counters['labels_extended']
+                self._is_truncated = self._is_truncated or is_truncated
+                if self.statistics is not None:
+                    for name, value in counters.items():
+                        setattr(self.statistics, name, getattr(self.statistics, name) + value)
+
+    def _get_round_budget(self) -> tuple:
+        """Get the maximal number of labels to extend by every worker and the time limit of the next round."""
+        max_labels, time_limit = self.batch_size, None
+        if self.max_labels is not None:
+            max_labels = min(max_labels, -(-(self.max_labels - self._extended_label_num) // self.processes))
+        if self._deadline is not None:
+            time_limit = max(self._deadline - perf_counter(), 0)
+        return max_labels, time_limit
+
+    def _set_solution(self):
+        """Collect the paths of the sink labels from the workers, and get the solution as LabelSetting."""
+        if self.processes > 1:
+            for sink_label in self._label_dict[self.graph.node_num - 1]:
+                label, parent_ref = sink_label, sink_label.parent_ref
+                while parent_ref is not None:
+                    worker_id, index = parent_ref
+                    conn = self._workers[worker_id][0]
+                    conn.send(('get_label', (index,)))
+                    graph_node_id, revised_cost, routing_time, demand, parent_ref = self._receive([conn])[0]
+                    label.pre_label = Label(graph_node_id, revised_cost, routing_time, demand)
+                    label = label.pre_label
+        super()._set_solution()
+
+    def _get_workers(self) -> list:
+        """Start the worker processes if necessary, and get the connections to them."""
+        if not self._workers:
+            for worker_id in range(self.processes):
+                conn, worker_conn = Pipe()
+                process = Process(target=_run_worker, daemon=True,
+                                  args=(worker_conn, self._graph, worker_id, self.processes, self._solver_kwargs))
+                process.start()
+                self._workers.append((conn, process))
+        return [conn for conn, _ in self._workers]
+
+    def _receive(self, workers: list) -> list:
+        """Receive the results of the last commands from the workers."""
+        results = []
+        for worker in workers:
+            is_ok, result = worker.recv()
+            if not is_ok:
+                raise RuntimeError(f'Worker process failed:\n{result}')
+            results.append(result)
+        return results
+
+    def close(self):
+        """Shut down the worker processes."""
+        for conn, process in self._workers:
+            conn.send(('close', ()))
+            process.join()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,70 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 5:10 AM
+# * Filename      : Resource
+# * Description   :
+# **********************************************************
+import numpy as np
+from src.graph.Graph import Graph
+from src.graph.ArrayGraph import ArrayGraph
+
+
+class Resource:
+
+    """Class for a resource of the resource-vector labels, see ResourceLabelSetting.
+
+    The resource extension function of arc (i, j) is r_j = max(lower_bound[j], r_i + consumption[i, j]), and the
+    extension is feasible iff r_j <= upper_bound[j], where consumption is a (node_num, node_num) matrix, and the
+    lower bound and upper bound are scalars or arrays of length node_num. The resource at the source node is the
+    lower bound of the source node. A label with not larger resource is better, hence the consumption should be
+    non-negative.
+
+    Typical usage example:
+
+    resources = [Resource.demand(graph_, 200), Resource.time(graph_), Resource.driving_time(graph_, 300)]
+    ls = ResourceLabelSetting(graph_, resources=resources)
+
+    """
+
+    def __init__(self, name: str, consumption, upper_bound, lower_bound=0.):
+        self.name = name
+        self.consumption = np.asarray(consumption, dtype=float)
+        self.upper_bound = upper_bound
+        self.lower_bound = lower_bound
+
+    def get_bounds(self, node_num: int) -> tuple:
+        """Get lower bound and upper bound as arrays of length node_num."""
+        return (np.broadcast_to(np.asarray(self.lower_bound, dtype=float), (node_num,)),
+                np.broadcast_to(np.asarray(self.upper_bound, dtype=float), (node_num,)))
+
+    @classmethod
+    def demand(cls, graph: Graph, capacity=100):
+        """Demand resource, i.e. the load of vehicle bounded by capacity."""
+        graph = _as_array_graph(graph)
+        return cls('demand', np.broadcast_to(graph.demand, (graph.node_num, graph.node_num)), capacity)
+
+    @classmethod
+    def time(cls, graph: Graph):
+        """Time resource, i.e. the routing time with time windows as in LabelSetting."""
+        graph = _as_array_graph(graph)
+        return cls('time', graph.routing_time + graph.service_time[None, :], graph.latest_time, graph.earliest_time)
+
+    @classmethod
+    def driving_time(cls, graph: Graph, max_driving_time: float):
+        """Driving time resource, i.e. the routing time of arcs without service and waiting time."""
+        graph = _as_array_graph(graph)
+        return cls('driving_time', graph.routing_time, max_driving_time)
+
+    @classmethod
+    def duration(cls, graph: Graph, max_duration: float):
+        """Duration resource, i.e. the routing time including service and waiting time, bounded by max_duration."""
+        graph = _as_array_graph(graph)
+        return cls('duration', graph.routing_time + graph.service_time[None, :], max_duration, graph.earliest_time)
+
+    def __str__(self):
+        return f'Resource({self.name})'
+
+
+def _as_array_graph(graph: Graph) -> ArrayGraph:
+    return graph if isinstance(graph, ArrayGraph) else ArrayGraph.from_graph(graph)
@@ -0,0 +1,265 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 5:30 AM
+# * Filename      : ResourceLabelSetting
+# * Description   :
+# **********************************************************
+import numpy as np
+from src.graph.Graph import Graph
+from src.graph.ArrayGraph import ArrayGraph
+from src.labeling.LabelSetting import Label
+from src.labeling.LabelStore import SinkLabelStore
+from src.labeling.Resource import Resource
+from src.labeling.VectorizedLabelSetting import VectorizedLabelSetting
+
+
+class ResourceLabel(Label):
+
+    """Class for label with a vector of resources, see Resource.
+
+    The vector of label is the revised cost followed by the resources, which is compared as a whole in dominance.
+    The routing time and demand of Label are the resources named 'time' and 'demand' if declared, or 0 otherwise,
+    so that the label selection works as in LabelSetting.
+
+    """
+
+    __slots__ = ('vector',)
+
+    def __init__(self, graph_node_id: int, vector: np.ndarray, routing_time=0, demand=0, pre_label=None):
+        super().__init__(graph_node_id, float(vector[0]), routing_time, demand, pre_label)
+        self.vector = vector
+
+    @property
+    def resources(self) -> np.ndarray:
+        return self.vector[1:]
+
+    def dominate(self, other, flag=False) -> bool:
+        """Check whether can dominate other label, i.e. not larger cost and resources, and no fewer reachable nodes."""
+        if flag:
+            return self.revised_cost < other.revised_cost
+        if (self.vector > other.vector).any():
+            return False
+        return not other.reachable_mask & ~self.reachable_mask
+
+
+class ResourceLabelStore:
+
+    """Class for the non-dominated resource labels of one graph node.
+
+    The vectors of labels, i.e. revised cost and resources, are packed into an array, so that a new label is compared
+    with all the labels of the store by vector comparisons, and only the labels with not larger (or not smaller)
+    vectors are compared by the reachable node sets. The interface is the same as LabelStore.
+
+    """
+
+    def __init__(self, resource_num: int, max_labels=None):
+        self.max_labels = max_labels
+        self.is_truncated = False
+        self._vectors = np.empty((8, resource_num + 1))
+        self._labels = []
+        self.compare_num = 0    # number of dominance comparisons
+        self.remove_num = 0    # number of labels removed since dominated by the inserted labels
+
+    def insert(self, label_2_compare: ResourceLabel) -> bool:
+        """Insert a label into the store, and return whether the label is non-dominated and has been inserted.
+
+        Note that, the labels dominated by the inserted label are removed from the store and marked as dominated.
+        """
+        labels, label_num = self._labels, len(self._labels)
+        vector, reachable_mask = label_2_compare.vector, label_2_compare.reachable_mask
+        if label_num:
+            self.compare_num += label_num
+            vectors = self._vectors[:label_num]
+            # Check whether the label is dominated by the labels with not larger cost and resources
+            for i in (vectors <= vector).all(axis=1).nonzero()[0].tolist():
+                if not reachable_mask & ~labels[i].reachable_mask:
+                    return False
+            # Remove the labels with not smaller cost and resources which are dominated by the label
+            dominated = [i for i in (vectors >= vector).all(axis=1).nonzero()[0].tolist()
+                         if not labels[i].reachable_mask & ~reachable_mask]
+            if dominated:
+                self._remove(dominated)
+                self.remove_num += len(dominated)
+
+        self._append(label_2_compare)
+        if self.max_labels is not None and len(labels) > self.max_labels:
+            # Remove the label with the largest revised cost
+            self.is_truncated = True
+            self.remove_num += 1
+            worst = int(np.argmax(self._vectors[:len(labels), 0]))
+            is_inserted = worst != len(labels) - 1
+            self._remove([worst])
+            return is_inserted
+        return True
+
+    def _append(self, label: ResourceLabel):
+        label_num = len(self._labels)
+        if label_num == len(self._vectors):
+            self._vectors = np.concatenate((self._vectors, np.empty_like(self._vectors)))
+        self._vectors[label_num] = label.vector
+        self._labels.append(label)
+
+    def _remove(self, indices: list):
+        """Remove labels by indices, and mark them as dominated."""
+        label_num = len(self._labels)
+        is_kept = np.ones(label_num, dtype=bool)
+        is_kept[indices] = False
+        for i in indices:
+            self._labels[i].is_dominated = True
+        kept_num = label_num - len(indices)
+        self._vectors[:kept_num] = self._vectors[:label_num][is_kept]
+        self._labels = [label for label, is_label_kept in zip(self._labels, is_kept.tolist()) if is_label_kept]
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __getitem__(self, index: int):
+        return self._labels[index]
+
+
+class ResourceLabelSetting(VectorizedLabelSetting):
+
+    """Class for label setting algorithm with a vector of resources.
+
+    The resources are declared once as a list of Resource, each with its own resource extension function and upper
+    bound, e.g. driving time and duration besides demand and time. Every label keeps its resources as a vector, a
+    label is extended to all of its reachable successors at once by operations over the packed (node, node,
+    resource) consumption array, and the dominance is checked by vector comparisons, see ResourceLabelStore. If
+    resources is None, the resources are demand bounded by capacity and time, i.e. the same problem as LabelSetting.
+
+    Note that, the completion bound is not supported, since it relies on the demand resource, i.e. ValueError is
+    raised if completion_bound is True, and neither is checkpoint.
+
+    Typical usage example:
+
+    resources = [Resource.demand(graph_, 200), Resource.time(graph_), Resource.driving_time(graph_, 300)]
+    ls = ResourceLabelSetting(graph_, resources=resources)
+    ls.solve(dual_val)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, resources=None, **kwargs):
+        if kwargs.get('completion_bound'):
+            raise ValueError(f'Completion bound of {type(self).__name__} is not supported.')
+        if not isinstance(graph, ArrayGraph):
+            graph = ArrayGraph.from_graph(graph)
+        if resources is None:
+            resources = [Resource.demand(graph, capacity), Resource.time(graph)]
+        self.resources = list(resources)
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+
+    def refresh(self):
+        """Precompute the packed resource arrays, and the feasible arcs by resource bounds."""
+        graph, n = self.graph, self.graph.node_num
+        names = [resource.name for resource in self.resources]
+        self._time_index = names.index('time') if 'time' in names else None
+        self._demand_index = names.index('demand') if 'demand' in names else None
+        # consumption[i, j, k] is the consumption of resource k on arc (i, j)
+        self._consumption = np.stack([resource.consumption for resource in self.resources], axis=-1)
+        bounds = [resource.get_bounds(n) for resource in self.resources]
+        self._lower_bound = np.stack([lower_bound for lower_bound, _ in bounds], axis=-1)
+        self._upper_bound_array = np.stack([upper_bound for _, upper_bound in bounds], axis=-1)
+
+        # The resources at node i are not smaller than its lower bound plus the least consumption of entering it
+        min_resources = np.maximum(
+            self._lower_bound, (self._lower_bound[:, None, :] + self._consumption).min(axis=0)
+        )
+        min_resources[0] = self._lower_bound[0]
+        # The resources of arc (i, j) are bounded after the lower bound of node j, e.g. waiting until the earliest time
+        is_arc_feasible = ~(np.maximum(self._lower_bound[None, :, :], min_resources[:, None, :] + self._consumption) >
+                            self._upper_bound_array[None, :, :]).any(axis=2)
+        unreachable_masks = graph.unreachable_masks
+        self._edge_dict, self._infeasible_masks = {}, {}
+        self._feasible_adjacency = np.zeros((n, n), dtype=bool)
+        for i in range(n):
+            edges, infeasible_mask = [], 0
+            for edge in graph.edge_dict[i]:
+                if is_arc_feasible[i, edge.to_]:
+                    edges.append(edge)
+                    self._feasible_adjacency[i, edge.to_] = True
+                else:
+                    infeasible_mask |= 1 << edge.to_
+            self._edge_dict[i] = edges    # feasible outgoing edges
+            if unreachable_masks is not None:
+                infeasible_mask |= unreachable_masks[i]
+            self._infeasible_masks[i] = infeasible_mask    # nodes which are never reachable from node i
+        self._successor_ids = [np.flatnonzero(self._feasible_adjacency[i]) for i in range(n)]
+        self._mask_bytes = (n + 7) // 8
+        self._source_reachable_mask = None
+        self._completion_bound = None
+
+    def _check_checkpoint_support(self):
+        # The resource vectors are not kept by Checkpoint
+        raise NotImplementedError(f'Checkpoint of {type(self).__name__} is not supported.')
+
+    def _init_label_dict(self) -> dict:
+        """Initialize packed label store for every nodes, where the sink node keeps the best max_columns labels."""
+        sink = self.graph.node_num - 1
+        return {
+            i: SinkLabelStore(self.max_columns) if i == sink else ResourceLabelStore(len(self.resources), self.max_labels_per_node)
+            for i in range(self.graph.node_num)
+        }
+
+    def _init_source_label(self):
+        """Put the label of source node into queue."""
+        init_label = self._create_label(0, np.concatenate(([0.], self._lower_bound[0])), None)
+        if self._source_reachable_mask is None:
+            unreachable = self._get_unreachable(init_label.resources[None, :], np.array([0]))[0]
+            self._source_reachable_mask = (((1 << self.graph.node_num) - 1) & ~(1 & self._critical_mask) &
+                                           ~self._infeasible_masks[0] & ~self._to_mask(unreachable))
+        init_label.update_reachable_mask(self._source_reachable_mask)
+        self._label_dict[0].insert(init_label)
+        self._unprocessed_labels.put_nowait(init_label)
+
+    def _create_label(self, graph_node_id: int, vector: np.ndarray, pre_label) -> ResourceLabel:
+        time_index, demand_index = self._time_index, self._demand_index
+        return ResourceLabel(graph_node_id, vector,
+                             float(vector[time_index + 1]) if time_index is not None else 0,
+                             float(vector[demand_index + 1]) if demand_index is not None else 0,
+                             pre_label)
+
+    def _get_unreachable(self, resources: np.ndarray, node_ids: np.ndarray) -> np.ndarray:
+        """Get the successors which are unreachable by resources, i.e. (label, node) array for labels at node_ids."""
+        return self._feasible_adjacency[node_ids] & (
+            np.maximum(self._lower_bound[None, :, :], resources[:, None, :] + self._consumption[node_ids]) >
+            self._upper_bound_array[None, :, :]
+        ).any(axis=2)
+
+    def _to_mask(self, is_node_set: np.ndarray) -> int:
+        return int.from_bytes(np.packbits(is_node_set, bitorder='little').tobytes(), 'little')
+
+    def batch_label_extension(self, cur_label: ResourceLabel):
+        """Extend label to all the reachable successors at once by the resource extension functions."""
+        cur_node_id = cur_label.graph_node_id
+        successors = self._successor_ids[cur_node_id]
+        if not successors.size:
+            return
+        # Filter the reachable successors
+        is_node_reachable = np.unpackbits(
+            np.frombuffer(cur_label.reachable_mask.to_bytes(self._mask_bytes, 'little'), dtype=np.uint8),
+            bitorder='little'
+        )
+        successors = successors[is_node_reachable[successors].astype(bool)]
+        if not successors.size:
+            return
+
+        # Vectors of the new labels, i.e. (successor, 1 + resource) array of revised cost and resources
+        vectors = np.empty((successors.size, len(self.resources) + 1))
+        np.add(cur_label.revised_cost, self.graph.revised_cost[cur_node_id, successors], out=vectors[:, 0])
+        resources = vectors[:, 1:]
+        np.maximum(cur_label.resources + self._consumption[cur_node_id, successors], self._lower_bound[successors],
+                   out=resources)
+        unreachable_bytes = np.packbits(self._get_unreachable(resources, successors), axis=1, bitorder='little')
+
+        pre_reachable_mask, critical_mask = cur_label.reachable_mask, self._critical_mask
+        for k, next_node_id in enumerate(successors.tolist()):
+            reachable_mask = pre_reachable_mask & ~((1 << next_node_id) & critical_mask)
+            reachable_mask &= ~self._infeasible_masks[next_node_id]
+            reachable_mask &= ~int.from_bytes(unreachable_bytes[k].tobytes(), 'little')
+            new_label = self._create_label(next_node_id, vectors[k], cur_label)
+            new_label.update_reachable_mask(reachable_mask)
+            self.dominance(new_label)
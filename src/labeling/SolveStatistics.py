@@ -0,0 +1,103 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 3:00 AM
+# * Filename      : SolveStatistics
+# * Description   :
+# **********************************************************
+from time import perf_counter
+
+
+class SolveStatistics:
+
+    """Class for statistics of the last solve of label setting.
+
+    The statistics are collected by wrapping the hot path methods of the label setting, i.e. label_extension,
+    _cal_reachable_mask and dominance, only if statistics is enabled, hence there is no overhead if disabled. The
+    per-node label set sizes are sampled every sample_interval generated labels, and then every callback is called
+    with the statistics, e.g. for progress report or profiling.
+
+    Note that, the time of a method includes the time of the methods called by it, e.g. the time of label_extension
+    includes the time of _cal_reachable_mask and dominance.
+
+    Typical usage example:
+
+    ls = LabelSetting(graph_, statistics=SolveStatistics(sample_interval=100, callbacks=[print]))
+    ls.solve(dual_val)
+    print(ls.statistics.to_dict())
+
+    """
+
+    def __init__(self, sample_interval=1000, callbacks=None):
+        self.sample_interval = sample_interval
+        self.callbacks = list(callbacks or [])
+        self.time = {}    # key: method name, value: seconds
+        self.reset()
+
+    def reset(self):
+        self.labels_generated = 0    # labels passed to dominance
+        self.labels_extended = 0
+        self.labels_inserted = 0    # labels inserted into the label stores
+        self.labels_rejected = 0    # labels dominated when generated
+        self.labels_removed = 0    # labels dominated after being inserted
+        self.labels_rejected_by_incumbent = 0    # sink labels which cannot improve the incumbent, see SinkLabelStore
+        self.extensions_pruned_by_reachability = 0    # extensions skipped since the next node is unreachable
+        self.dominance_comparisons = 0
+        self.queue_high_water = 0
+        self.label_set_sizes = []    # list of (labels generated, label set size of every node)
+        for name in self.time:
+            self.time[name] = 0.0
+
+    @property
+    def labels_dominated(self) -> int:
+        return self.labels_rejected + self.labels_removed
+
+    @property
+    def labels_pruned_by_bound(self) -> int:
+        """Labels dropped by completion bound, i.e. neither inserted nor rejected."""
+        return (self.labels_generated - self.labels_inserted - self.labels_rejected -
+                self.labels_rejected_by_incumbent)
+
+    def sample(self, label_dict: dict):
+        """Sample the label set sizes, and call the callbacks."""
+        self.label_set_sizes.append((self.labels_generated, [len(store) for store in label_dict.values()]))
+        for callback in self.callbacks:
+            callback(self)
+
+    def timed(self, name: str, method):
+        """Wrap method to accumulate its time by name."""
+        time = self.time
+        time.setdefault(name, 0.0)
+
+        def timed_method(*args):
+            start_time = perf_counter()
+            try:
+                return method(*args)
+            finally:
+                time[name] += perf_counter() - start_time
+
+        return timed_method
+
+    def to_dict(self) -> dict:
+        return {
+            'labels_generated': self.labels_generated,
+            'labels_extended': self.labels_extended,
+            'labels_inserted': self.labels_inserted,
+            'labels_dominated': self.labels_dominated,
+            'labels_pruned_by_bound': self.labels_pruned_by_bound,
+            'labels_rejected_by_incumbent': self.labels_rejected_by_incumbent,
+            'extensions_pruned_by_reachability': self.extensions_pruned_by_reachability,
+            'dominance_comparisons': self.dominance_comparisons,
+            'queue_high_water': self.queue_high_water,
+            'label_set_sizes': self.label_set_sizes,
+            'time': dict(self.time)
+        }
+
+    def __str__(self):
+        time = ', '.join(f'{name} {seconds:.3f}s' for name, seconds in self.time.items())
+        return (f'{self.labels_generated} labels generated, {self.labels_extended} extended, '
+                f'{self.labels_dominated} dominated, {self.labels_pruned_by_bound} pruned by bound, '
+                f'{self.labels_rejected_by_incumbent} rejected by incumbent, '
+                f'{self.extensions_pruned_by_reachability} extensions pruned by reachability, '
+                f'{self.dominance_comparisons} dominance comparisons, queue high water {self.queue_high_water}; '
+                f'{time}')
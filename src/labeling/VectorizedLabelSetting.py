@@ -0,0 +1,109 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 5:30 PM
+# * Filename      : VectorizedLabelSetting
+# * Description   :
+# **********************************************************
+import numpy as np
+from src.graph.Graph import Graph
+from src.graph.ArrayGraph import ArrayGraph
+from src.labeling.LabelSetting import LabelSetting, Label
+
+
+class VectorizedLabelSetting(LabelSetting):
+
+    """Class for label setting algorithm with vectorized label extension.
+
+    A label is extended to all of its reachable successors at once, where the demand, routing time, revised cost
+    and the reachable nodes set of the new labels are computed by NumPy array operations on an ArrayGraph, and
+    only the new labels are materialized as Label objects before the dominance check.
+
+    Typical usage example:
+
+    ls = VectorizedLabelSetting(graph_)    # graph_ is converted to ArrayGraph if necessary
+    ls.solve(dual_val)
+
+    """
+
+    def __init__(self, graph: Graph, branch_arc=None, branch_value=None, capacity=100, **kwargs):
+        if not isinstance(graph, ArrayGraph):
+            graph = ArrayGraph.from_graph(graph)
+        super().__init__(graph, branch_arc, branch_value, capacity, **kwargs)
+
+    def refresh(self):
+        """Precompute the dual-independent data, including the arrays for vectorized extension."""
+        super().refresh()
+        n = self.graph.node_num
+        self._feasible_adjacency = np.zeros((n, n), dtype=bool)
+        for i in range(n):
+            for edge in self._edge_dict[i]:
+                self._feasible_adjacency[i, edge.to_] = True
+        self._successor_ids = [np.flatnonzero(self._feasible_adjacency[i]) for i in range(n)]
+        # routing time offset from node i to node j, i.e. service time of node j plus routing time of edge (i, j)
+        self._routing_time_offset = self.graph.routing_time + self.graph.service_time[None, :]
+        self._mask_bytes = (n + 7) // 8
+
+    def _process_labels(self):
+        """Extend the unprocessed labels until the queue is empty or the budget is exhausted."""
+        has_budget, has_checkpoint = self._has_budget(), self._start_checkpoint()
+        while not self._unprocessed_labels.empty():
+            if has_checkpoint:
+                self._save_checkpoint_if_due()
+            cur_label = self._unprocessed_labels.get_nowait()
+            if cur_label.is_dominated:
+                continue
+            if has_budget and self._is_budget_exhausted():
+                self._unprocessed_labels.put_nowait(cur_label)
+                break
+            self.batch_label_extension(cur_label)
+
+    def _instrument(self):
+        """Wrap the hot path methods of the instance to collect statistics."""
+        super()._instrument()
+        statistics = self.statistics
+        batch_label_extension = statistics.timed('batch_label_extension', self.batch_label_extension)
+
+        def counted_batch_label_extension(cur_label: Label):
+            statistics.labels_extended += 1
+            batch_label_extension(cur_label)
+
+        self.batch_label_extension = counted_batch_label_extension
+
+    def batch_label_extension(self, cur_label: Label):
+        """Extend label to all the reachable successors at once."""
+        cur_node_id = cur_label.graph_node_id
+        successors = self._successor_ids[cur_node_id]
+        if not successors.size:
+            return
+        # Filter the reachable successors
+        is_node_reachable = np.unpackbits(
+            np.frombuffer(cur_label.reachable_mask.to_bytes(self._mask_bytes, 'little'), dtype=np.uint8),
+            bitorder='little'
+        )
+        successors = successors[is_node_reachable[successors].astype(bool)]
+        if not successors.size:
+            return
+
+        graph = self.graph
+        demand = cur_label.demand + graph.demand[successors]
+        routing_time = np.maximum(
+            cur_label.routing_time + self._routing_time_offset[cur_node_id, successors], graph.earliest_time[successors]
+        )
+        revised_cost = cur_label.revised_cost + graph.revised_cost[cur_node_id, successors]
+        # Successors of the new labels which are unreachable by demand or routing time
+        unreachable = self._feasible_adjacency[successors] & (
+            (demand[:, None] + graph.demand[None, :] > self.capacity) |
+            (routing_time[:, None] + self._routing_time_offset[successors] > graph.latest_time[None, :])
+        )
+        unreachable_bytes = np.packbits(unreachable, axis=1, bitorder='little')
+
+        pre_reachable_mask, critical_mask = cur_label.reachable_mask, self._critical_mask
+        revised_cost, routing_time, demand = revised_cost.tolist(), routing_time.tolist(), demand.tolist()
+        for k, next_node_id in enumerate(successors.tolist()):
+            reachable_mask = pre_reachable_mask & ~((1 << next_node_id) & critical_mask)
+            reachable_mask &= ~self._infeasible_masks[next_node_id]
+            reachable_mask &= ~int.from_bytes(unreachable_bytes[k].tobytes(), 'little')
+            new_label = Label(next_node_id, revised_cost[k], routing_time[k], demand[k], pre_label=cur_label)
+            new_label.update_reachable_mask(reachable_mask)
+            self.dominance(new_label)
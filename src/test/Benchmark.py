@@ -0,0 +1,189 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 2:10 AM
+# * Filename      : Benchmark
+# * Description   :
+# **********************************************************
+import json
+import os
+import platform
+import tracemalloc
+from datetime import datetime
+from random import Random
+from statistics import median
+from time import perf_counter
+
+from src.graph.SolomonLoader import SolomonLoader, TIME_FACTOR
+from src.labeling.LabelSetting import LabelSetting
+
+
+class Benchmark:
+
+    """Class for benchmark of label setting algorithm on the Solomon instances.
+
+    The instances of the given families, e.g. 'C1', are solved with the first node_num nodes for every node number,
+    where the costs and the dual value are generated with the seed, so that the results are reproducible. The
+    routing time per unit distance is time_factor, which is TIME_FACTOR by default as SolomonLoader. For every run,
+    the median wall time of repeats solves, the statistics of the solve (see SolveStatistics), and the peak memory
+    are recorded, and the results are saved as JSON, which can be compared with the results of another version by
+    compare.
+
+    Note that, the statistics and the peak memory are collected in another solve with statistics enabled, so that
+    the wall time is not affected. check_equivalence solves every instance with solver_class and a reference solver,
+    e.g. LabelSetting, and reports the instances where the reduced costs or the status differ.
+
+    Typical usage example:
+
+    benchmark = Benchmark(families=('C1', 'C2', 'R1'), node_nums=(10, 15), seed=0)
+    benchmark.run()
+    benchmark.save('bench_results.json')
+    Benchmark.compare('bench_results_old.json', 'bench_results.json')
+    Benchmark(families=('C2', 'R2'), solver_class=BidirectionalLabelSetting).check_equivalence(seeds=range(5))
+
+    """
+
+    def __init__(self, inst_dir='./res/solomon-json', families=('C1', 'C2', 'R1'), node_nums=(10, 15), seed=0,
+                 time_factor=TIME_FACTOR, solver_class=LabelSetting, solver_kwargs=None, trace_memory=True,
+                 cache_dir=None, repeats=1):
+        self.inst_dir = inst_dir
+        self.families = families
+        self.node_nums = node_nums
+        self.seed = seed
+        self.time_factor = time_factor
+        self.solver_class = solver_class
+        self.solver_kwargs = solver_kwargs or {}
+        self.trace_memory = trace_memory
+        self.repeats = repeats
+        self.loader = SolomonLoader(inst_dir, cache_dir)
+        self.results = []
+
+    def get_inst_names(self) -> list:
+        """Get the names of instances in the families, e.g. 'C1' matches 'C101', but not 'RC101'."""
+        inst_names = [file_name[:-len('.json')] for file_name in os.listdir(self.inst_dir)
+                      if file_name.endswith('.json')]
+        return sorted(name for name in inst_names
+                      if any(name.startswith(family) and name[len(family):].isdigit() for family in self.families))
+
+    def run_one(self, inst_name: str, node_num: int) -> dict:
+        """Solve one instance, and return the result record."""
+        inst = self.loader.load(inst_name, node_num, self.seed, time_factor=self.time_factor)
+        rand = Random(self.seed)
+        dual_val = [100 * rand.random() for _ in range(inst.node_num)]
+        graph = inst.get_graph()
+        wall_times = []
+        for _ in range(self.repeats):
+            solver = self.solver_class(graph, capacity=inst.capacity, **self.solver_kwargs)
+            start_time = perf_counter()
+            solver.solve(dual_val)
+            wall_times.append(perf_counter() - start_time)
+
+        instrumented_solver = self.solver_class(graph, capacity=inst.capacity, statistics=True, **self.solver_kwargs)
+        peak_memory = None
+        if self.trace_memory:
+            tracemalloc.start()
+        instrumented_solver.solve(dual_val)
+        if self.trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        statistics = instrumented_solver.statistics.to_dict()
+        del statistics['label_set_sizes']
+
+        return {
+            'inst_name': inst_name,
+            'node_num': inst.node_num,
+            'seed': self.seed,
+            'time_factor': self.time_factor,
+            'solver': self.solver_class.__name__,
+            'status': solver.status,
+            'reduced_cost': solver.reduced_cost if solver.shortest_path else None,
+            'shortest_path': solver.shortest_path or None,
+            'wall_time': median(wall_times),
+            'wall_times': wall_times,
+            'labels_created': statistics['labels_generated'],
+            'labels_dominated': statistics['labels_dominated'],
+            'peak_memory': peak_memory,
+            'statistics': statistics
+        }
+
+    def run(self, verbose=True) -> list:
+        """Run all the instances and node numbers."""
+        self.results = []
+        for inst_name in self.get_inst_names():
+            for node_num in self.node_nums:
+                result = self.run_one(inst_name, node_num)
+                self.results.append(result)
+                if verbose:
+                    print(f"{inst_name:>6} {node_num:>4} {result['status']:>10} {result['wall_time']:>9.3f}s "
+                          f"{result['labels_created']:>9} labels")
+        return self.results
+
+    def check_equivalence(self, reference_class=LabelSetting, seeds=(0,), verbose=True) -> list:
+        """Check that solver_class finds the same reduced cost and status as reference_class on every instance.
+
+        Returns: list of (inst_name, node_num, seed, reference status, reference cost, status, cost) which differ.
+
+        """
+        mismatches = []
+        for inst_name in self.get_inst_names():
+            for node_num in self.node_nums:
+                for seed in seeds:
+                    inst = self.loader.load(inst_name, node_num, seed, time_factor=self.time_factor)
+                    rand = Random(seed)
+                    dual_val = [100 * rand.random() for _ in range(inst.node_num)]
+                    graph = inst.get_graph()
+                    reference = reference_class(graph, capacity=inst.capacity)
+                    reference.solve(dual_val)
+                    solver = self.solver_class(graph, capacity=inst.capacity, **self.solver_kwargs)
+                    solver.solve(dual_val)
+                    reference_cost = reference.reduced_cost if reference.shortest_path else None
+                    cost = solver.reduced_cost if solver.shortest_path else None
+                    if reference.status != solver.status or (reference_cost is None) != (cost is None) or (
+                            cost is not None and abs(reference_cost - cost) > 1e-6):
+                        mismatches.append((inst_name, inst.node_num, seed, reference.status, reference_cost,
+                                           solver.status, cost))
+                        if verbose:
+                            print(f'{inst_name:>6} {inst.node_num:>4} {seed:>4} {reference.status:>10} '
+                                  f'{reference_cost} {solver.status:>10} {cost} MISMATCH')
+        if verbose:
+            print(f'{len(mismatches)} mismatches of {self.solver_class.__name__} against {reference_class.__name__}')
+        return mismatches
+
+    def save(self, path: str):
+        """Save results as JSON, with the environment info."""
+        with open(path, 'w') as f:
+            json.dump({
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'solver': self.solver_class.__name__,
+                'solver_kwargs': {key: repr(value) for key, value in self.solver_kwargs.items()},
+                'results': self.results
+            }, f, indent=2)
+
+    @staticmethod
+    def compare(old_path: str, new_path: str, verbose=True) -> list:
+        """Compare two results files by wall time and labels created.
+
+        Returns: list of (inst_name, node_num, old wall time, new wall time, whether the reduced costs are equal).
+
+        """
+        with open(old_path, 'r') as f:
+            old_results = {(r['inst_name'], r['node_num'], r['seed']): r for r in json.load(f)['results']}
+        with open(new_path, 'r') as f:
+            new_results = json.load(f)['results']
+        rows = []
+        for new in new_results:
+            old = old_results.get((new['inst_name'], new['node_num'], new['seed']))
+            if old is None:
+                continue
+            is_equal = (old['reduced_cost'] is None) == (new['reduced_cost'] is None) and (
+                old['reduced_cost'] is None or abs(old['reduced_cost'] - new['reduced_cost']) < 1e-6
+            )
+            rows.append((new['inst_name'], new['node_num'], old['wall_time'], new['wall_time'], is_equal))
+            if verbose:
+                ratio = new['wall_time'] / old['wall_time'] if old['wall_time'] else float('inf')
+                print(f"{new['inst_name']:>6} {new['node_num']:>4} {old['wall_time']:>9.3f}s {new['wall_time']:>9.3f}s "
+                      f"x{ratio:.2f} {old['labels_created']:>9} {new['labels_created']:>9} "
+                      f"{'' if is_equal else 'MISMATCH'}")
+        return rows
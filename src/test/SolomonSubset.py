@@ -0,0 +1,75 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:20 PM
+# * Filename      : SolomonSubset
+# * Description   :
+# **********************************************************
+import json
+import math
+import os
+from random import Random
+
+from src.graph.Graph import Graph
+from src.graph.GraphNode import GraphNode
+from src.graph.GraphEdge import GraphEdge
+
+INST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'res', 'solomon-json')
+
+# Small seeded subsets of the Solomon instances as (instance name, node number, time factor), which every solver
+# solves in well under a second, and which have non-trivial optimal paths except for R101
+CASES = [('C101', 15, 1), ('C103', 12, 5), ('C201', 15, 5), ('C202', 12, 15), ('R101', 15, 15), ('R103', 15, 1),
+         ('R202', 15, 1), ('RC201', 12, 5)]
+SEEDS = (0, 1, 2)
+
+
+def build_graph(inst_name: str, node_num: int, seed: int, time_factor=15) -> Graph:
+    """Build the graph of the first node_num customers, as LabelSettingTest does, with seeded random costs."""
+    with open(os.path.join(INST_DIR, f'{inst_name}.json'), 'r') as f:
+        customers = json.load(f)['all_customers']
+    rand = Random(seed)
+    node_list = []
+    for i in range(node_num):
+        customer = customers[f'{i}']
+        node_list.append(GraphNode(i, customer['x_coord'], customer['y_coord'], customer['demand'],
+                                   customer['ready_time'], customer['due_time'], customer['service_time']))
+    edge_dict = {}
+    for i in range(node_num - 1):
+        edge_dict[i] = []
+        for j in range(1, node_num):
+            if i != j:
+                distance = int(math.hypot(node_list[i].x_coord - node_list[j].x_coord,
+                                          node_list[i].y_coord - node_list[j].y_coord))
+                edge_dict[i].append(GraphEdge(i, j, rand.randint(1, 5) * distance, time_factor * distance))
+    edge_dict[node_num - 1] = []
+    return Graph(node_list, edge_dict)
+
+
+def build_dual_val(node_num: int, seed: int) -> list:
+    """Build seeded random dual values."""
+    rand = Random(seed + 1000)
+    return [100 * rand.random() for _ in range(node_num)]
+
+
+def check_path(graph: Graph, dual_val: list, path: list, reduced_cost: float, capacity=100):
+    """Check that the path is an elementary feasible path from source to sink with the given reduced cost."""
+    assert path[0] == 0 and path[-1] == graph.node_num - 1, path
+    assert len(set(path)) == len(path), path
+    routing_time = demand = cost = 0
+    for from_, to_ in zip(path, path[1:]):
+        edge = next(edge for edge in graph.edge_dict[from_] if edge.to_ == to_)
+        to_node = graph.node_list[to_]
+        routing_time = max(routing_time + to_node.service_time + edge.routing_time, to_node.earliest_time)
+        assert routing_time <= to_node.latest_time, (path, to_)
+        demand += to_node.demand
+        cost += graph.original_cost_map[from_, to_] - dual_val[from_]
+    assert demand <= capacity, path
+    assert math.isclose(cost, reduced_cost, abs_tol=1e-6), (cost, reduced_cost)
+
+
+def check_same_solution(solver, reference, graph: Graph, dual_val: list, capacity=100):
+    """Check that the solver finds a path as good as the reference LabelSetting, or none if the reference does not."""
+    assert bool(solver.shortest_path) == bool(reference.shortest_path), (solver.shortest_path, reference.shortest_path)
+    if reference.shortest_path:
+        assert math.isclose(solver.reduced_cost, reference.reduced_cost, abs_tol=1e-6)
+        check_path(graph, dual_val, solver.shortest_path, solver.reduced_cost, capacity)
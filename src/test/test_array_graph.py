@@ -0,0 +1,32 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:00 PM
+# * Filename      : test_array_graph
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.graph.ArrayGraph import ArrayGraph
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import CASES, build_graph, build_dual_val, check_same_solution
+
+
+def test_revised_cost_map_is_the_same_dict():
+    graph, dual_val = build_graph('C101', 15, 0), build_dual_val(15, 0)
+    array_graph = ArrayGraph.from_graph(graph)
+    graph.revise_cost_map(dual_val)
+    array_graph.revise_cost_map(dual_val)
+    assert array_graph.revised_cost_map == graph.revised_cost_map
+    for (from_, to_), revised_cost in graph.revised_cost_map.items():
+        assert array_graph.revised_cost[from_, to_] == pytest.approx(revised_cost)
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_label_setting_on_array_graph(inst_name, node_num, time_factor):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = LabelSetting(ArrayGraph.from_graph(graph))
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
@@ -0,0 +1,28 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:20 PM
+# * Filename      : test_batch_pricing
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.BatchPricing import BatchPricing
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import SEEDS, build_graph, build_dual_val, check_path
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', [('C101', 15, 1), ('R202', 15, 1)])
+def test_same_as_label_setting(inst_name, node_num, time_factor):
+    graph = build_graph(inst_name, node_num, 0, time_factor)
+    jobs = [(build_dual_val(node_num, seed), None) for seed in SEEDS]
+    jobs.append((build_dual_val(node_num, 0), [((0, node_num - 1), 0)]))
+    with BatchPricing(graph, processes=2) as pricing:
+        results = pricing.solve(jobs)
+    assert len(results) == len(jobs)
+    for (dual_val, branch_decisions), columns in zip(jobs, results):
+        reference = LabelSetting(graph, branch_decisions=branch_decisions)
+        reference.solve(dual_val)
+        assert len(columns) == 1
+        assert columns[0].reduced_cost == pytest.approx(reference.reduced_cost)
+        check_path(graph, dual_val, columns[0].path, columns[0].reduced_cost)
@@ -0,0 +1,34 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:30 PM
+# * Filename      : test_bidirectional
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.BidirectionalLabelSetting import BidirectionalLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+# C2/R2 cases where the midpoint is between the time windows of many customers
+MIDPOINT_CASES = [('C202', 14, 15), ('C203', 14, 15), ('R204', 15, 5)]
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES + MIDPOINT_CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = BidirectionalLabelSetting(graph)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+def test_pricing_mode_rejects_non_negative_paths():
+    graph = build_graph('C201', 15, 0)
+    solver = BidirectionalLabelSetting(graph, pricing_mode=True)
+    solver.solve([0] * graph.node_num)
+    assert solver.shortest_path == []
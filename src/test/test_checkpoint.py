@@ -0,0 +1,69 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 8:40 AM
+# * Filename      : test_checkpoint
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.Checkpoint import Checkpoint
+from src.labeling.DSSRLabelSetting import DSSRLabelSetting
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.ResourceLabelSetting import ResourceLabelSetting
+from src.labeling.VectorizedLabelSetting import VectorizedLabelSetting
+from src.test.SolomonSubset import CASES, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('solver_class', [LabelSetting, VectorizedLabelSetting])
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_resume_truncated_solve(tmp_path, inst_name, node_num, time_factor, solver_class):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = solver_class(graph, max_labels=20, max_columns=3)
+    solver.solve(dual_val)
+    checkpoint_path = str(tmp_path / 'checkpoint.bin')
+    solver.save_checkpoint(checkpoint_path)
+    # The checkpoint is saved and loaded as is
+    checkpoint, loaded = Checkpoint.from_label_setting(solver), Checkpoint.load(checkpoint_path)
+    assert loaded.meta == checkpoint.meta
+    assert all(loaded.arrays[name] == values for name, values in checkpoint.arrays.items())
+
+    resumed = solver_class(graph, max_columns=3)
+    resumed.resume(checkpoint_path)
+    assert resumed.status == reference.status
+    check_same_solution(resumed, reference, graph, dual_val)
+    full = solver_class(graph, max_columns=3)
+    full.solve(dual_val)
+    assert [column.reduced_cost for column in resumed.columns] == pytest.approx(
+        [column.reduced_cost for column in full.columns])
+
+
+def test_checkpoint_saved_during_solve(tmp_path):
+    graph, dual_val = build_graph('R202', 15, 0, 1), build_dual_val(15, 0)
+    checkpoint_path = str(tmp_path / 'checkpoint.bin')
+    solver = LabelSetting(graph, checkpoint_path=checkpoint_path, checkpoint_interval=0)
+    solver.solve(dual_val)
+    # The last checkpoint is saved before the last label is extended, hence the resumed solve is the same
+    resumed = LabelSetting(graph)
+    resumed.resume(checkpoint_path)
+    check_same_solution(resumed, solver, graph, dual_val)
+
+
+def test_resume_checks_solver_and_graph(tmp_path):
+    graph, dual_val = build_graph('C101', 15, 0, 1), build_dual_val(15, 0)
+    solver = LabelSetting(graph, max_labels=5)
+    solver.solve(dual_val)
+    checkpoint_path = str(tmp_path / 'checkpoint.bin')
+    solver.save_checkpoint(checkpoint_path)
+    with pytest.raises(ValueError):
+        VectorizedLabelSetting(graph).resume(checkpoint_path)
+    with pytest.raises(ValueError):
+        LabelSetting(graph, branch_decisions=[((0, 14), 0)]).resume(checkpoint_path)
+    with pytest.raises(ValueError):
+        LabelSetting(build_graph('C101', 15, 1, 1)).resume(checkpoint_path)
+    with pytest.raises(NotImplementedError):
+        ResourceLabelSetting(graph).resume(checkpoint_path)
+    with pytest.raises(NotImplementedError):
+        DSSRLabelSetting(graph).resume(checkpoint_path)
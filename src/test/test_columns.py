@@ -0,0 +1,64 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 6:40 AM
+# * Filename      : test_columns
+# * Description   :
+# **********************************************************
+import math
+
+import pytest
+
+from src.labeling.BidirectionalLabelSetting import BidirectionalLabelSetting
+from src.labeling.CompactLabelSetting import CompactLabelSetting
+from src.labeling.DSSRLabelSetting import DSSRLabelSetting
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.ResourceLabelSetting import ResourceLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_path, check_same_solution
+
+
+def _check_columns(solver, graph, dual_val, max_columns):
+    assert len(solver.columns) <= max_columns
+    assert len({tuple(column.path) for column in solver.columns}) == len(solver.columns)
+    assert all(a.reduced_cost <= b.reduced_cost for a, b in zip(solver.columns, solver.columns[1:]))
+    for column in solver.columns:
+        check_path(graph, dual_val, column.path, column.reduced_cost)
+        assert math.isclose(column.original_cost, graph.get_original_cost(column.path))
+    if solver.columns:
+        assert solver.shortest_path == solver.columns[0].path
+
+
+@pytest.mark.parametrize('solver_class', [LabelSetting, CompactLabelSetting, DSSRLabelSetting, ResourceLabelSetting])
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_best_columns(inst_name, node_num, time_factor, seed, solver_class):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = solver_class(graph, max_columns=5)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+    _check_columns(solver, graph, dual_val, 5)
+    if reference.shortest_path and solver_class is not DSSRLabelSetting:
+        # The columns are the paths of the sink labels, hence every solver finds the same number of columns
+        labels = LabelSetting(graph, max_columns=5)
+        labels.solve(dual_val)
+        assert [c.reduced_cost for c in solver.columns] == pytest.approx([c.reduced_cost for c in labels.columns])
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_negative_columns_in_pricing_mode(inst_name, node_num, time_factor):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    solver = LabelSetting(graph, max_columns=10, pricing_mode=True)
+    solver.solve(dual_val)
+    _check_columns(solver, graph, dual_val, 10)
+    assert all(column.reduced_cost < 0 for column in solver.columns)
+    incumbent = LabelSetting(graph, pricing_mode=True)
+    incumbent.solve(dual_val)
+    assert [column.path for column in incumbent.columns] == ([incumbent.shortest_path] if incumbent.shortest_path
+                                                             else [])
+
+
+def test_multiple_columns_not_supported_by_bidirectional():
+    with pytest.raises(ValueError):
+        BidirectionalLabelSetting(build_graph('C101', 15, 0, 1), max_columns=2)
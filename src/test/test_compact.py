@@ -0,0 +1,45 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 1:10 AM
+# * Filename      : test_compact
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.CompactLabelSetting import CompactLabelSetting
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('label_selection', ['cost', 'time', 'fifo', 'lifo'])
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed, label_selection):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph, label_selection=label_selection)
+    reference.solve(dual_val)
+    solver = CompactLabelSetting(graph, label_selection=label_selection)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_statistics_as_label_setting(inst_name, node_num, time_factor):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    reference = LabelSetting(graph, statistics=True, max_labels_per_node=3)
+    reference.solve(dual_val)
+    solver = CompactLabelSetting(graph, statistics=True, max_labels_per_node=3)
+    solver.solve(dual_val)
+    assert solver.status == reference.status
+    assert solver.shortest_path == reference.shortest_path
+    for name in ('labels_generated', 'labels_inserted', 'labels_removed', 'labels_rejected', 'dominance_comparisons'):
+        assert getattr(solver.statistics, name) == getattr(reference.statistics, name), name
+    # Only the labels in the stores and their ancestors are kept by the pool
+    assert len(solver.label_pool) <= solver.statistics.labels_inserted + 1
+
+
+def test_checkpoint_not_supported(tmp_path):
+    graph = build_graph('C101', 15, 0, 1)
+    with pytest.raises(NotImplementedError):
+        CompactLabelSetting(graph, checkpoint_path=str(tmp_path / 'ck'), checkpoint_interval=1)
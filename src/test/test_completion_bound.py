@@ -0,0 +1,36 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:40 PM
+# * Filename      : test_completion_bound
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = LabelSetting(graph, completion_bound=True)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+@pytest.mark.parametrize('completion_bound', [False, True])
+def test_pricing_mode(completion_bound):
+    graph = build_graph('C202', 12, 0)
+    solver = LabelSetting(graph, completion_bound=completion_bound, pricing_mode=True)
+    solver.solve([0] * graph.node_num)
+    assert solver.shortest_path == []
+    dual_val = build_dual_val(graph.node_num, 0)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver.solve(dual_val)
+    assert reference.reduced_cost < 0
+    check_same_solution(solver, reference, graph, dual_val)
@@ -0,0 +1,34 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:40 PM
+# * Filename      : test_dssr
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.DSSRLabelSetting import DSSRLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = DSSRLabelSetting(graph)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+def test_repeated_solves_keep_critical_nodes():
+    graph = build_graph('C201', 15, 0)
+    solver = DSSRLabelSetting(graph)
+    for seed in SEEDS:
+        dual_val = build_dual_val(graph.node_num, seed)
+        reference = LabelSetting(graph)
+        reference.solve(dual_val)
+        solver.solve(dual_val)
+        check_same_solution(solver, reference, graph, dual_val)
@@ -0,0 +1,68 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 7:40 AM
+# * Filename      : test_fleet
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.BatchPricing import BatchPricing
+from src.labeling.FleetLabelSetting import FleetLabelSetting
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_path
+
+VEHICLE_TYPES = [(40, 0), (70, 15), (100, 30)]
+VEHICLE_DUAL_VAL = [5, 10, 50]
+
+
+def _check_same_as_label_setting(graph, dual_val, columns, pricing_mode=False):
+    """Check that the column of every vehicle type is as good as LabelSetting with its capacity and fixed cost."""
+    assert len(columns) == len(VEHICLE_TYPES)
+    for (capacity, fixed_cost), dual, column in zip(VEHICLE_TYPES, VEHICLE_DUAL_VAL, columns):
+        reference = LabelSetting(graph, capacity=capacity)
+        reference.solve(dual_val)
+        offset = fixed_cost - dual
+        if not reference.shortest_path or (pricing_mode and reference.reduced_cost + offset >= 0):
+            assert column is None
+            continue
+        assert column.reduced_cost == pytest.approx(reference.reduced_cost + offset)
+        check_path(graph, dual_val, column.path, column.reduced_cost - offset, capacity)
+        assert column.original_cost == pytest.approx(graph.get_original_cost(column.path) + fixed_cost)
+
+
+@pytest.mark.parametrize('pricing_mode', [False, True])
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed, pricing_mode):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    solver = FleetLabelSetting(graph, vehicle_types=VEHICLE_TYPES, pricing_mode=pricing_mode)
+    solver.solve(dual_val, VEHICLE_DUAL_VAL)
+    _check_same_as_label_setting(graph, dual_val, solver.columns, pricing_mode)
+    found_columns = [column for column in solver.columns if column is not None]
+    if found_columns:
+        assert solver.reduced_cost == pytest.approx(min(found_columns).reduced_cost)
+
+
+def test_capacity_is_checked():
+    graph = build_graph('C101', 15, 0, 1)
+    assert FleetLabelSetting(graph, vehicle_types=VEHICLE_TYPES, capacity=100).capacity == 100
+    assert FleetLabelSetting(graph, vehicle_types=VEHICLE_TYPES, capacity=200).capacity == 100
+    with pytest.raises(ValueError):
+        FleetLabelSetting(graph, vehicle_types=VEHICLE_TYPES, capacity=50)
+
+
+def test_batch_pricing():
+    graph, node_num = build_graph('R202', 15, 0, 1), 15
+    jobs = [(build_dual_val(node_num, seed), None) for seed in SEEDS]
+    with BatchPricing(graph, capacity=100, solver_class=FleetLabelSetting, processes=2,
+                      vehicle_types=VEHICLE_TYPES, pricing_mode=True) as pricing:
+        results = pricing.solve(jobs)
+    assert len(results) == len(jobs)
+    for (dual_val, _), columns in zip(jobs, results):
+        reference = FleetLabelSetting(graph, vehicle_types=VEHICLE_TYPES, pricing_mode=True)
+        reference.solve(dual_val)
+        expected = [column for column in reference.columns if column is not None]
+        assert [(column.path, column.reduced_cost) for column in columns] == [
+            (column.path, pytest.approx(column.reduced_cost)) for column in expected
+        ]
@@ -0,0 +1,38 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 10:50 PM
+# * Filename      : test_heuristic
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.HeuristicLabelSetting import HeuristicLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_path
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_columns_are_negative_and_feasible(inst_name, node_num, time_factor, seed):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = HeuristicLabelSetting(graph, max_labels_per_node=5, max_columns=5)
+    solver.solve(dual_val)
+    assert len(solver.columns) <= 5
+    assert [column.reduced_cost for column in solver.columns] == sorted(column.reduced_cost for column in solver.columns)
+    for column in solver.columns:
+        assert reference.reduced_cost - 1e-6 <= column.reduced_cost < 0
+        check_path(graph, dual_val, column.path, column.reduced_cost)
+
+
+def test_store_counters():
+    graph = build_graph('C201', 15, 0)
+    solver = HeuristicLabelSetting(graph, max_labels_per_node=2)
+    solver.solve(build_dual_val(graph.node_num, 0))
+    stores = [solver._label_dict[i] for i in range(graph.node_num - 1)]
+    assert sum(store.compare_num for store in stores) > 0
+    assert sum(store.remove_num for store in stores) > 0
+    assert any(store.is_truncated for store in stores)
+    assert all(len(store) <= 2 for store in stores)
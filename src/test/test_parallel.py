@@ -0,0 +1,24 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:30 PM
+# * Filename      : test_parallel
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.ParallelLabelSetting import ParallelLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor):
+    graph = build_graph(inst_name, node_num, 0, time_factor)
+    with ParallelLabelSetting(graph, processes=3, batch_size=16) as solver:
+        for seed in SEEDS:
+            dual_val = build_dual_val(node_num, seed)
+            reference = LabelSetting(graph)
+            reference.solve(dual_val)
+            solver.solve(dual_val)
+            check_same_solution(solver, reference, graph, dual_val)
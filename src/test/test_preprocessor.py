@@ -0,0 +1,35 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/18 11:50 PM
+# * Filename      : test_preprocessor
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.graph.Graph import Graph
+from src.graph.GraphPreprocessor import GraphPreprocessor
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import CASES, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    preprocessed_graph = Graph(graph.node_list, {i: list(graph.edge_dict[i]) for i in range(graph.node_num)})
+    GraphPreprocessor(preprocessed_graph).run()
+    solver = LabelSetting(preprocessed_graph)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, preprocessed_graph, dual_val)
+
+
+def test_shared_nodes_are_not_changed():
+    graph = build_graph('R202', 15, 0, 1)
+    time_windows = [(node.earliest_time, node.latest_time) for node in graph.node_list]
+    shared_graph = Graph(graph.node_list, {i: list(graph.edge_dict[i]) for i in range(graph.node_num)})
+    preprocessor = GraphPreprocessor(shared_graph)
+    preprocessor.run()
+    assert preprocessor.tightened_node_num > 0
+    assert [(node.earliest_time, node.latest_time) for node in graph.node_list] == time_windows
@@ -0,0 +1,40 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 5:50 AM
+# * Filename      : test_resource
+# * Description   :
+# **********************************************************
+import pytest
+
+from src.labeling.LabelSetting import LabelSetting
+from src.labeling.Resource import Resource
+from src.labeling.ResourceLabelSetting import ResourceLabelSetting
+from src.test.SolomonSubset import CASES, SEEDS, build_graph, build_dual_val, check_same_solution
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_same_as_label_setting(inst_name, node_num, time_factor, seed):
+    graph, dual_val = build_graph(inst_name, node_num, seed, time_factor), build_dual_val(node_num, seed)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    solver = ResourceLabelSetting(graph)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+@pytest.mark.parametrize('inst_name, node_num, time_factor', CASES)
+def test_loose_resource_does_not_change_solution(inst_name, node_num, time_factor):
+    graph, dual_val = build_graph(inst_name, node_num, 0, time_factor), build_dual_val(node_num, 0)
+    reference = LabelSetting(graph)
+    reference.solve(dual_val)
+    resources = [Resource.demand(graph, 100), Resource.time(graph), Resource.driving_time(graph, float('inf'))]
+    solver = ResourceLabelSetting(graph, resources=resources)
+    solver.solve(dual_val)
+    check_same_solution(solver, reference, graph, dual_val)
+
+
+def test_completion_bound_not_supported():
+    with pytest.raises(ValueError):
+        ResourceLabelSetting(build_graph('C101', 15, 0, 1), completion_bound=True)
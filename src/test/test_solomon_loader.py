@@ -0,0 +1,83 @@
+# **********************************************************
+# * Author        : CO2MAKER
+# * Email         : 429401330@qq.com
+# * Create time   : 2026/10/19 1:30 AM
+# * Filename      : test_solomon_loader
+# * Description   :
+# **********************************************************
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from src.graph.ArrayGraph import ArrayGraph
+from src.graph.SolomonLoader import SolomonLoader
+from src.labeling.LabelSetting import LabelSetting
+from src.test.SolomonSubset import INST_DIR, build_dual_val
+
+
+def _check_same_instance(inst, other):
+    assert (inst.inst_name, inst.capacity, inst.vehicle_num) == (other.inst_name, other.capacity, other.vehicle_num)
+    np.testing.assert_array_equal(inst.node_data, other.node_data)
+    np.testing.assert_array_equal(inst.cost, other.cost)
+    np.testing.assert_array_equal(inst.routing_time, other.routing_time)
+    if inst.unreachable_bits is None:
+        assert other.unreachable_bits is None
+    else:
+        np.testing.assert_array_equal(inst.unreachable_bits, other.unreachable_bits)
+
+
+@pytest.mark.parametrize('capacity', [None, 200])
+def test_cache_round_trip(tmp_path, capacity):
+    parsed = SolomonLoader(INST_DIR).load('C201', node_num=20, seed=0, capacity=capacity)
+    loader = SolomonLoader(INST_DIR, str(tmp_path))
+    _check_same_instance(parsed, loader.load('C201', node_num=20, seed=0, capacity=capacity))
+    cached = loader.load('C201', node_num=20, seed=0, capacity=capacity)
+    assert isinstance(cached.cost, np.memmap)
+    _check_same_instance(parsed, cached)
+    # The graph of the cached instance has the same solution
+    dual_val = build_dual_val(20, 0)
+    solutions = []
+    for inst in (parsed, cached):
+        ls = LabelSetting(inst.get_graph(), capacity=inst.capacity)
+        ls.solve(dual_val)
+        solutions.append((ls.shortest_path, ls.reduced_cost))
+    assert solutions[0] == solutions[1]
+
+
+def test_cache_key_of_instance_file(tmp_path):
+    inst_dir, cache_dir = tmp_path / 'inst', str(tmp_path / 'cache')
+    inst_dir.mkdir()
+    shutil.copy(os.path.join(INST_DIR, 'C101.json'), inst_dir)
+    loader = SolomonLoader(str(inst_dir), cache_dir)
+    loader.load('C101', node_num=10)
+    # Another inst_dir has its own cache
+    SolomonLoader(INST_DIR, cache_dir).load('C101', node_num=10)
+    assert len(os.listdir(cache_dir)) == 2
+    # The cache is rebuilt if the instance file is revised
+    inst_file_path = inst_dir / 'C101.json'
+    with open(inst_file_path, 'r') as f:
+        solomon_inst = json.load(f)
+    solomon_inst['all_customers']['1']['demand'] += 1
+    with open(inst_file_path, 'w') as f:
+        json.dump(solomon_inst, f)
+    stat = os.stat(inst_file_path)
+    os.utime(inst_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    inst = loader.load('C101', node_num=10)
+    assert inst.node_data[1, 2] == solomon_inst['all_customers']['1']['demand']
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_array_graph_from_matrices():
+    inst = SolomonLoader(INST_DIR).load('C101', node_num=15, seed=0)
+    graph, array_graph = inst.get_graph(), inst.get_graph(ArrayGraph)
+    rebuilt = ArrayGraph(graph.node_list, graph.edge_dict)
+    np.testing.assert_array_equal(array_graph.adjacency, rebuilt.adjacency)
+    np.testing.assert_array_equal(array_graph.original_cost, rebuilt.original_cost)
+    np.testing.assert_array_equal(array_graph.routing_time, rebuilt.routing_time)
+    for i in range(graph.node_num):
+        assert [(edge.to_, edge.revised_cost, edge.routing_time) for edge in graph.edge_dict[i]] == [
+            (j, inst.cost[i, j], inst.routing_time[i, j]) for j in np.flatnonzero(np.isfinite(inst.cost[i]))
+        ]
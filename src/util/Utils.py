@@ -5,3 +5,51 @@
 # * Filename      : Utils
 # * Description   :
 # **********************************************************
+
+
+def list_to_mask(bool_list: list) -> int:
+    """Convert a list of booleans into an integer bitmask, i.e. bit i is set iff bool_list[i] is True."""
+    mask = 0
+    for i, item in enumerate(bool_list):
+        if item:
+            mask |= 1 << i
+    return mask
+
+
+def mask_to_list(mask: int, size: int) -> list:
+    """Convert an integer bitmask into a list of booleans with the given size."""
+    return [bool((mask >> i) & 1) for i in range(size)]
+
+
+class BitView:
+
+    """Class for read-only list-like view of an integer bitmask.
+
+    Note that, the view does not know the number of nodes of the graph, so the length of the view is the
+    bit length of the mask, and every index beyond the length is regarded as False.
+
+    Typical usage example:
+
+    view = BitView(0b101)
+    view[0], view[1], view[2]    # True, False, True
+
+    """
+
+    __slots__ = ('mask',)
+
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __getitem__(self, index: int) -> bool:
+        return bool((self.mask >> index) & 1)
+
+    def __len__(self):
+        return self.mask.bit_length()
+
+    def __iter__(self):
+        mask = self.mask
+        for i in range(mask.bit_length()):
+            yield bool((mask >> i) & 1)
+
+    def __str__(self):
+        return str(list(self))